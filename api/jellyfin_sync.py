@@ -60,6 +60,24 @@ class SyncProgress:
     error_message: Optional[str] = None
     current_item: Optional[str] = None
 
+# Matched by jellyfin_id first; an item that reappears under a new Jellyfin id
+# but the same TMDB id is re-pointed rather than duplicated
+_MEDIA_UPSERT_COLUMNS = "tmdb_id = excluded.tmdb_id, jellyfin_id = excluded.jellyfin_id, " \
+    "title = excluded.title, year = excluded.year, type = excluded.type, " \
+    "overview = excluded.overview, genres = excluded.genres, path = excluded.path, " \
+    "updated_at = CURRENT_TIMESTAMP"
+_MEDIA_UPSERT_CHANGED = "tmdb_id IS NOT excluded.tmdb_id OR jellyfin_id IS NOT excluded.jellyfin_id " \
+    "OR title IS NOT excluded.title OR year IS NOT excluded.year OR type IS NOT excluded.type " \
+    "OR overview IS NOT excluded.overview OR genres IS NOT excluded.genres OR path IS NOT excluded.path"
+_MEDIA_UPSERT_SQL = f"""
+    INSERT INTO media (
+        jellyfin_id, tmdb_id, title, year, type,
+        overview, genres, path, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(jellyfin_id) DO UPDATE SET {_MEDIA_UPSERT_COLUMNS} WHERE {_MEDIA_UPSERT_CHANGED}
+    ON CONFLICT(tmdb_id) DO UPDATE SET {_MEDIA_UPSERT_COLUMNS} WHERE {_MEDIA_UPSERT_CHANGED}
+"""
+
 class JellyfinSyncManager:
     """Hybrid synchronization manager for Jellyfin data"""
 
@@ -78,6 +96,8 @@ class JellyfinSyncManager:
 
         # Sync state
         self.current_sync: Optional[SyncProgress] = None
+        # Set whenever current_sync changes, so monitors can wait instead of polling
+        self._progress_event = asyncio.Event()
 
     def get_local_db_connection(self) -> sqlite3.Connection:
         """Get connection to local Parody Critics database"""
@@ -240,6 +260,44 @@ class JellyfinSyncManager:
             logger.error(f"Error getting media counts: {e}")
             return {'movies': 0, 'series': 0, 'total': 0}
 
+    def get_media_counts_with_local(self, conn: sqlite3.Connection) -> Tuple[Dict[str, int], int]:
+        """Jellyfin media counts plus the local media count, in one statement on the local connection.
+
+        The Jellyfin database is ATTACHed read-only (conn must be opened with uri=True)
+        instead of opening a second connection. Falls back to zero Jellyfin counts
+        if it cannot be attached or read (not a Jellyfin database, locked, corrupt),
+        like get_media_count_from_jellyfin_db.
+        """
+        try:
+            conn.execute("ATTACH DATABASE ? AS jf", (f"file:{self.jellyfin_db_path}?mode=ro",))
+        except sqlite3.Error as e:
+            logger.error(f"Error getting media counts: {e}")
+            local_count = conn.execute("SELECT COUNT(*) FROM media").fetchone()[0]
+            return {'movies': 0, 'series': 0, 'total': 0}, local_count
+
+        try:
+            movies, series, local_count = conn.execute("""
+                SELECT
+                    (SELECT COUNT(*) FROM jf.BaseItems
+                     WHERE Type = 'MediaBrowser.Controller.Entities.Movies.Movie'
+                       AND Name IS NOT NULL AND LENGTH(TRIM(Name)) > 0),
+                    (SELECT COUNT(*) FROM jf.BaseItems
+                     WHERE Type = 'MediaBrowser.Controller.Entities.TV.Series'
+                       AND Name IS NOT NULL AND LENGTH(TRIM(Name)) > 0),
+                    (SELECT COUNT(*) FROM main.media)
+            """).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Error getting media counts: {e}")
+            movies = series = local_count = None
+        finally:
+            conn.execute("DETACH DATABASE jf")
+
+        if local_count is None:
+            local_count = conn.execute("SELECT COUNT(*) FROM media").fetchone()[0]
+            return {'movies': 0, 'series': 0, 'total': 0}, local_count
+
+        return {'movies': movies, 'series': series, 'total': movies + series}, local_count
+
     def sync_media_to_local_db(self, media_items: List[MediaItem]) -> Tuple[int, int]:
         """Sync media items to local database"""
         successful = 0
@@ -251,13 +309,11 @@ class JellyfinSyncManager:
 
                 for item in media_items:
                     try:
-                        # Insert or update media in local database
-                        cursor.execute("""
-                            INSERT OR REPLACE INTO media (
-                                jellyfin_id, tmdb_id, title, year, type,
-                                overview, genres, path, created_at
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
+                        # Insert or update media in local database. UPSERT updates the
+                        # existing row in place (keeping its id, created_at, enrichment and,
+                        # through the FK cascade, its critics) and skips unchanged rows;
+                        # INSERT OR REPLACE deleted and re-inserted it every sync.
+                        cursor.execute(_MEDIA_UPSERT_SQL, (
                             item.id,
                             item.tmdb_id,
                             item.name,
@@ -332,6 +388,7 @@ class JellyfinSyncManager:
                 self.current_sync.processed_items = offset + len(media_batch)
                 self.current_sync.successful_items = total_successful
                 self.current_sync.failed_items = total_failed
+                self._progress_event.set()
 
                 logger.info(f"Batch complete: {successful}/{len(media_batch)} successful, {failed} failed")
 
@@ -343,6 +400,7 @@ class JellyfinSyncManager:
             # Complete sync
             self.current_sync.status = SyncStatus.COMPLETED
             self.current_sync.end_time = datetime.now(timezone.utc)
+            self._progress_event.set()
 
             duration = (self.current_sync.end_time - self.current_sync.start_time).total_seconds()
 
@@ -359,6 +417,7 @@ class JellyfinSyncManager:
                 self.current_sync.status = SyncStatus.FAILED
                 self.current_sync.error_message = str(e)
                 self.current_sync.end_time = datetime.now(timezone.utc)
+                self._progress_event.set()
 
             self._log_sync_error(sync_id, str(e))
             raise
@@ -413,6 +472,15 @@ class JellyfinSyncManager:
         except Exception as e:
             logger.error(f"Failed to log sync error: {e}")
 
+    async def wait_for_progress(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the sync reports progress; returns False if the timeout expires first"""
+        try:
+            await asyncio.wait_for(self._progress_event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._progress_event.clear()
+        return True
+
     def get_sync_progress(self) -> Optional[Dict[str, Any]]:
         """Get current sync progress"""
         if not self.current_sync:
@@ -444,6 +512,7 @@ class JellyfinSyncManager:
         if self.current_sync and self.current_sync.status == SyncStatus.RUNNING:
             self.current_sync.status = SyncStatus.CANCELLED
             self.current_sync.end_time = datetime.now(timezone.utc)
+            self._progress_event.set()
             logger.info(f"Sync {self.current_sync.sync_id} cancelled")
             return True
         return False
\ No newline at end of file
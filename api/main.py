@@ -133,30 +133,36 @@ def _run_auto_migrations(db_path: str):
         if "avatar_url" not in existing_char_cols:
             migrations.append("ALTER TABLE characters ADD COLUMN avatar_url TEXT")
 
-        # FTS5 index for media search
-        vtables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='media_fts'").fetchall()}
-        if "media_fts" not in vtables:
-            conn.execute("CREATE VIRTUAL TABLE media_fts USING FTS5 (title, content=media)")
+        # FTS5 index for media search (title + genres)
+        fts_cols = {r[1] for r in conn.execute("PRAGMA table_info(media_fts)").fetchall()}
+        if fts_cols and "genres" not in fts_cols:
+            # Legacy title-only index: drop it and its triggers so both are recreated below
+            for trigger in ("media_fts_insert", "media_fts_delete", "media_fts_update"):
+                conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            conn.execute("DROP TABLE media_fts")
+            fts_cols = set()
+        if not fts_cols:
+            conn.execute("CREATE VIRTUAL TABLE media_fts USING FTS5 (title, genres, content=media, content_rowid=id)")
 
         # Sync triggers so new media rows are indexed immediately
         triggers = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='trigger'").fetchall()}
         if "media_fts_insert" not in triggers:
             conn.execute("""
                 CREATE TRIGGER media_fts_insert AFTER INSERT ON media BEGIN
-                    INSERT INTO media_fts(rowid, title) VALUES (new.id, new.title);
+                    INSERT INTO media_fts(rowid, title, genres) VALUES (new.id, new.title, new.genres);
                 END
             """)
         if "media_fts_delete" not in triggers:
             conn.execute("""
                 CREATE TRIGGER media_fts_delete AFTER DELETE ON media BEGIN
-                    INSERT INTO media_fts(media_fts, rowid, title) VALUES('delete', old.id, old.title);
+                    INSERT INTO media_fts(media_fts, rowid, title, genres) VALUES('delete', old.id, old.title, old.genres);
                 END
             """)
         if "media_fts_update" not in triggers:
             conn.execute("""
-                CREATE TRIGGER media_fts_update AFTER UPDATE OF title ON media BEGIN
-                    INSERT INTO media_fts(media_fts, rowid, title) VALUES('delete', old.id, old.title);
-                    INSERT INTO media_fts(rowid, title) VALUES (new.id, new.title);
+                CREATE TRIGGER media_fts_update AFTER UPDATE OF title, genres ON media BEGIN
+                    INSERT INTO media_fts(media_fts, rowid, title, genres) VALUES('delete', old.id, old.title, old.genres);
+                    INSERT INTO media_fts(rowid, title, genres) VALUES (new.id, new.title, new.genres);
                 END
             """)
 
@@ -164,6 +170,11 @@ def _run_auto_migrations(db_path: str):
         conn.execute("INSERT INTO media_fts(media_fts) VALUES('rebuild')")
         setup_logger.info("FTS index rebuilt")
 
+        # Covering index for title-ordered listings (id rides along as the rowid)
+        indexes = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'").fetchall()}
+        if "idx_media_title_cover" not in indexes:
+            migrations.append("CREATE INDEX IF NOT EXISTS idx_media_title_cover ON media(title, year, type)")
+
         # Motif history table
         if "character_motif_history" not in tables:
             migrations.append("""
@@ -674,15 +685,16 @@ async def search_media(
     """
 
     # Build FTS5 query: each word quoted (escapes operators), last word gets * for prefix match.
-    # "Mari"       → "Mari"*           → matches Marilyn, Marino, etc.
-    # "Marilyn Ma" → "Marilyn" "Ma"*   → matches Marilyn Manson, Marilyn Mansion, etc.
+    # Scoped to the title column — the index also holds genres, which this endpoint ignores.
+    # "Mari"       → title : ("Mari"*)           → matches Marilyn, Marino, etc.
+    # "Marilyn Ma" → title : ("Marilyn" "Ma"*)   → matches Marilyn Manson, Marilyn Mansion, etc.
     def build_fts_query(q: str) -> str:
         words = q.strip().split()
         tokens = []
         for i, word in enumerate(words):
             escaped = word.replace('"', '""')   # only " needs escaping inside quoted token
             tokens.append(f'"{escaped}"*' if i == len(words) - 1 else f'"{escaped}"')
-        return " ".join(tokens)
+        return f"title : ({' '.join(tokens)})"
 
     fts_query = build_fts_query(query)
 
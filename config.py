@@ -3,12 +3,19 @@
 Environment-based configuration for different deployment scenarios
 """
 
+import functools
 import os
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file — once per process tree: child
+# processes inherit the populated environment and skip the file lookup
+if not os.getenv('PARODY_CRITICS_DOTENV_LOADED'):
+    load_dotenv()
+    os.environ['PARODY_CRITICS_DOTENV_LOADED'] = '1'
+
+# Directory relative DATABASE_PATH values are anchored to
+_CONFIG_DIR = Path(__file__).resolve().parent
 
 class Config:
     """Base configuration class"""
@@ -32,23 +39,25 @@ class Config:
     # CORS Settings
     # JELLYFIN_URL is added automatically — no need to hardcode your IP here.
     # Add extra origins via PARODY_CRITICS_CORS_ORIGINS=http://host1,http://host2
-    CORS_ORIGINS = [
+    CORS_ORIGINS = (
         "http://localhost:8096",
         "http://127.0.0.1:8096",
         # Testing origins
         "http://localhost:3000",
         "http://localhost:8080",
         "http://127.0.0.1:3000",
-        "null"  # For file:// protocol testing
-    ]
-    # Automatically allow the configured Jellyfin instance
-    if JELLYFIN_URL not in CORS_ORIGINS:
-        CORS_ORIGINS.append(JELLYFIN_URL)
+        "null",  # For file:// protocol testing
+        # Automatically allow the configured Jellyfin instance
+        JELLYFIN_URL,
+    )
 
     # Add custom origins from environment
     custom_origins = os.getenv('PARODY_CRITICS_CORS_ORIGINS', '')
     if custom_origins:
-        CORS_ORIGINS.extend([origin.strip() for origin in custom_origins.split(',')])
+        CORS_ORIGINS += tuple(origin.strip() for origin in custom_origins.split(',') if origin.strip())
+
+    # Deduplicate once, preserving order
+    CORS_ORIGINS = tuple(dict.fromkeys(CORS_ORIGINS))
 
     # Performance
     CACHE_DURATION = int(os.getenv('PARODY_CRITICS_CACHE_DURATION', '300'))  # 5 minutes
@@ -97,11 +106,12 @@ class Config:
     AVATAR_DIR = os.getenv('AVATAR_DIR', 'data/avatars')
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def get_absolute_db_path(cls) -> str:
-        """Get absolute path to database"""
+        """Get absolute path to database (resolved once per config class)"""
         if os.path.isabs(cls.DATABASE_PATH):
             return cls.DATABASE_PATH
-        return str(Path(__file__).parent / cls.DATABASE_PATH)
+        return str(_CONFIG_DIR / cls.DATABASE_PATH)
 
 class DevelopmentConfig(Config):
     """Development environment configuration"""
@@ -125,10 +135,14 @@ config_map = {
     'production': ProductionConfig
 }
 
+@functools.lru_cache(maxsize=None)
+def _config_for(environment: str) -> Config:
+    """One shared, read-only instance per environment name"""
+    return config_map.get(environment, DevelopmentConfig)()
+
 def get_config(environment: str = None) -> Config:
     """Get configuration based on environment"""
     if environment is None:
         environment = os.getenv('PARODY_CRITICS_ENV', 'development')
 
-    config_class = config_map.get(environment, DevelopmentConfig)
-    return config_class()
\ No newline at end of file
+    return _config_for(environment)
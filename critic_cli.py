@@ -50,6 +50,9 @@ def cli(ctx, debug: bool, config_file: str):
         console.print(f"[dim]Make sure {config_file} exists or run the setup wizard first.[/dim]")
         sys.exit(1)
 
+    # Database connection is shared by the whole invocation, opened on first use
+    ctx.obj['db'] = None
+
 
 @cli.command()
 @click.argument('title', required=False)
@@ -81,12 +84,12 @@ def generate(ctx, title: str, character: str, year: int, media_type: str,
 
     # Get media information
     if from_db and not title:
-        media_info = _select_from_database(config)
+        media_info = _select_from_database(_get_db(ctx))
         if not media_info:
             console.print("[yellow]No media selected from database[/yellow]")
             return
     elif from_db and title:
-        media_info = _search_in_database(title, config)
+        media_info = _search_in_database(title, _get_db(ctx))
         if not media_info:
             console.print(f"[red]❌ '{title}' not found in database[/red]")
             return
@@ -103,7 +106,8 @@ def generate(ctx, title: str, character: str, year: int, media_type: str,
         }
 
     # Generate the review
-    asyncio.run(_generate_review(config, character, media_info, save))
+    db = _get_db(ctx) if save else None
+    asyncio.run(_generate_review(config, character, media_info, db))
 
 
 @cli.command()
@@ -112,33 +116,12 @@ def generate(ctx, title: str, character: str, year: int, media_type: str,
 def history(ctx, limit: int):
     """📋 Show recent generated reviews"""
 
-    config = ctx.obj['config']
-
     console.print(Panel(
         f"[bold blue]📋 Recent Reviews History[/bold blue]\n\nShowing last {limit} generated reviews",
         style="bright_blue"
     ))
 
     try:
-        with sqlite3.connect(config.DATABASE_PATH) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                """
-                SELECT c.*, m.title, m.year, m.type, ch.name as character_name
-                FROM critics c
-                JOIN media m ON c.media_id = m.id
-                JOIN characters ch ON c.character_id = ch.id
-                ORDER BY c.generated_at DESC
-                LIMIT ?
-                """,
-                (limit,)
-            )
-            reviews = cursor.fetchall()
-
-        if not reviews:
-            console.print("\n[dim]No reviews found in database[/dim]")
-            return
-
         # Create history table
         history_table = Table(
             title="Recent Reviews",
@@ -151,19 +134,39 @@ def history(ctx, limit: int):
         history_table.add_column("Rating", style="green")
         history_table.add_column("Preview", style="dim")
 
-        for review in reviews:
-            date_str = review['generated_at'].split()[0] if review['generated_at'] else 'Unknown'
-            media_title = f"{review['title']} ({review['year']})"
-            preview = review['content'][:50] + "..." if len(review['content']) > 50 else review['content']
+        cursor = _get_db(ctx).execute(
+            """
+            SELECT c.generated_at, c.rating,
+                   CASE WHEN length(c.content) > 50
+                        THEN substr(c.content, 1, 50) || '...'
+                        ELSE c.content END AS preview,
+                   m.title, m.year, ch.name as character_name
+            FROM critics c
+            JOIN media m ON c.media_id = m.id
+            JOIN characters ch ON c.character_id = ch.id
+            ORDER BY c.generated_at DESC
+            LIMIT ?
+            """,
+            (limit,)
+        )
+
+        # Stream rows straight from the cursor into the table
+        for generated_at, rating, preview, title, year, character_name in cursor:
+            date_str = generated_at.split()[0] if generated_at else 'Unknown'
+            media_title = f"{title} ({year})"
 
             history_table.add_row(
                 date_str,
                 media_title,
-                review['character_name'],
-                f"{review['rating']}/10",
+                character_name,
+                f"{rating}/10",
                 preview
             )
 
+        if not history_table.row_count:
+            console.print("\n[dim]No reviews found in database[/dim]")
+            return
+
         console.print(history_table)
 
     except Exception as e:
@@ -192,32 +195,12 @@ def status(ctx):
 def search(ctx, search_term: str):
     """🔍 Search media in database"""
 
-    config = ctx.obj['config']
-
     console.print(Panel(
         f"[bold blue]🔍 Searching Media[/bold blue]\n\nSearching for: '{search_term}'",
         style="bright_blue"
     ))
 
     try:
-        with sqlite3.connect(config.DATABASE_PATH) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                """
-                SELECT id, title, year, type, genres
-                FROM media
-                WHERE title LIKE ? OR genres LIKE ?
-                ORDER BY title
-                LIMIT 20
-                """,
-                (f'%{search_term}%', f'%{search_term}%')
-            )
-            results = cursor.fetchall()
-
-        if not results:
-            console.print(f"\n[yellow]No media found matching '{search_term}'[/yellow]")
-            return
-
         # Create results table
         results_table = Table(
             title="Search Results",
@@ -230,15 +213,52 @@ def search(ctx, search_term: str):
         results_table.add_column("Type", style="blue")
         results_table.add_column("Genres", style="dim")
 
-        for item in results:
+        conn = _get_db(ctx)
+        fts_query = _build_fts_query(search_term)
+        cursor = None
+        if fts_query:
+            try:
+                cursor = conn.execute(
+                    """
+                    SELECT m.id, m.title, m.year, m.type, m.genres
+                    FROM media_fts
+                    JOIN media m ON m.id = media_fts.rowid
+                    WHERE media_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT 20
+                    """,
+                    (fts_query,)
+                )
+            except sqlite3.OperationalError as e:
+                if not _fts_missing(e):
+                    raise
+        if cursor is None:
+            # Database predates the FTS index, or the term has no words to
+            # match — fall back to a LIKE scan (an empty term lists all media)
+            cursor = conn.execute(
+                """
+                SELECT id, title, year, type, genres
+                FROM media
+                WHERE title LIKE ? OR genres LIKE ?
+                ORDER BY title
+                LIMIT 20
+                """,
+                (f'%{search_term}%', f'%{search_term}%')
+            )
+
+        for media_id, title, year, media_type, genres in cursor:
             results_table.add_row(
-                str(item['id']),
-                item['title'],
-                str(item['year']) if item['year'] else 'Unknown',
-                item['type'].title() if item['type'] else 'Unknown',
-                item['genres'] if item['genres'] else 'Unknown'
+                str(media_id),
+                title,
+                str(year) if year else 'Unknown',
+                media_type.title() if media_type else 'Unknown',
+                genres if genres else 'Unknown'
             )
 
+        if not results_table.row_count:
+            console.print(f"\n[yellow]No media found matching '{search_term}'[/yellow]")
+            return
+
         console.print(results_table)
 
     except Exception as e:
@@ -263,15 +283,45 @@ def test(ctx):
 
 # Helper functions
 
-def _select_from_database(config: Config) -> dict:
+def _get_db(ctx) -> sqlite3.Connection:
+    """Return the invocation's shared database connection, opening it on first use"""
+    conn = ctx.obj.get('db')
+    if conn is None:
+        # Default tuple rows: callers unpack positionally in SELECT-list order
+        conn = sqlite3.connect(ctx.obj['config'].get_absolute_db_path())
+        ctx.obj['db'] = conn
+        ctx.call_on_close(conn.close)
+    return conn
+
+
+def _build_fts_query(term: str, column: str = None) -> str:
+    """Build an FTS5 MATCH expression: each word quoted, last word prefix-matched
+
+    Returns None for a blank term, which has no valid MATCH expression.
+    """
+    words = term.split()
+    if not words:
+        return None
+    tokens = []
+    for i, word in enumerate(words):
+        escaped = word.replace('"', '""')
+        tokens.append(f'"{escaped}"*' if i == len(words) - 1 else f'"{escaped}"')
+    query = " ".join(tokens)
+    return f"{column} : ({query})" if column else query
+
+
+def _fts_missing(error: sqlite3.OperationalError) -> bool:
+    """True when the error only means the database has no media_fts index yet"""
+    return 'no such table: media_fts' in str(error)
+
+
+def _select_from_database(conn: sqlite3.Connection) -> dict:
     """Interactive selection from database"""
     try:
-        with sqlite3.connect(config.DATABASE_PATH) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT id, title, year, type FROM media ORDER BY title LIMIT 20"
-            )
-            media_list = cursor.fetchall()
+        cursor = conn.execute(
+            "SELECT id, title, year, type FROM media ORDER BY title LIMIT 20"
+        )
+        media_list = cursor.fetchall()
 
         if not media_list:
             console.print("[red]❌ No media found in database[/red]")
@@ -279,7 +329,8 @@ def _select_from_database(config: Config) -> dict:
 
         console.print("\n[bold]📚 Available Media:[/bold]")
         for i, item in enumerate(media_list, 1):
-            console.print(f"  {i:2d}. {item['title']} ({item['year']}) - {item['type'].title()}")
+            _, title, year, media_type = item
+            console.print(f"  {i:2d}. {title} ({year}) - {media_type.title()}")
 
         choice = click.prompt(
             "\nSelect media (number)",
@@ -287,7 +338,7 @@ def _select_from_database(config: Config) -> dict:
         )
 
         selected = media_list[choice - 1]
-        return dict(selected)
+        return dict(zip(('id', 'title', 'year', 'type'), selected))
 
     except Exception as e:
         logger.error(f"Database selection failed: {str(e)}")
@@ -295,26 +346,46 @@ def _select_from_database(config: Config) -> dict:
         return None
 
 
-def _search_in_database(title: str, config: Config) -> dict:
+def _search_in_database(title: str, conn: sqlite3.Connection) -> dict:
     """Search for specific title in database"""
     try:
-        with sqlite3.connect(config.DATABASE_PATH) as conn:
-            conn.row_factory = sqlite3.Row
+        fts_query = _build_fts_query(title, column='title')
+        cursor = None
+        if fts_query:
+            try:
+                cursor = conn.execute(
+                    """
+                    SELECT m.*
+                    FROM media_fts
+                    JOIN media m ON m.id = media_fts.rowid
+                    WHERE media_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT 1
+                    """,
+                    (fts_query,)
+                )
+            except sqlite3.OperationalError as e:
+                if not _fts_missing(e):
+                    raise
+        if cursor is None:
             cursor = conn.execute(
                 "SELECT * FROM media WHERE title LIKE ? LIMIT 1",
                 (f'%{title}%',)
             )
-            result = cursor.fetchone()
+        result = cursor.fetchone()
 
-        return dict(result) if result else None
+        if not result:
+            return None
+        return dict(zip((column[0] for column in cursor.description), result))
 
     except Exception as e:
         logger.error(f"Database search failed: {str(e)}")
         return None
 
 
-async def _generate_review(config: Config, character: str, media_info: dict, save: bool):
-    """Generate review using LLM"""
+async def _generate_review(config: Config, character: str, media_info: dict,
+                           db: sqlite3.Connection = None):
+    """Generate review using LLM; saves it when a database connection is given"""
 
     logger.info(f"Starting review generation - Character: {character}, Media: {media_info['title']}")
 
@@ -352,8 +423,8 @@ async def _generate_review(config: Config, character: str, media_info: dict, sav
             _display_review(result, parsed_review, media_info)
 
             # Save if requested
-            if save:
-                _save_review_to_database(config, parsed_review, media_info, character)
+            if db is not None:
+                _save_review_to_database(db, parsed_review, media_info, character)
 
         else:
             console.print("\n[red]❌ Review generation failed[/red]")
@@ -401,10 +472,25 @@ def _display_review(result: dict, parsed_review: dict, media_info: dict):
     console.print(review_panel)
 
 
-def _save_review_to_database(config: Config, parsed_review: dict, media_info: dict, character: str):
-    """Save review to database"""
+def _save_review_to_database(conn: sqlite3.Connection, parsed_review, media_info, character: str):
+    """Save review to database
+
+    Accepts a single parsed review and its media info, or matching lists of
+    both for the same character; every row is written in one transaction.
+    """
+    if isinstance(parsed_review, dict):
+        parsed_review, media_info = [parsed_review], [media_info]
+
+    # Only media already in the database can hold a review
+    pending = [(review, media['id']) for review, media in zip(parsed_review, media_info) if media.get('id')]
+    skipped = len(parsed_review) - len(pending)
+    if skipped:
+        console.print(f"[yellow]⚠️  Media not in database - {skipped} review(s) not saved[/yellow]")
+    if not pending:
+        return
+
     try:
-        with sqlite3.connect(config.DATABASE_PATH) as conn:
+        with conn:
             # Get or create character
             cursor = conn.execute(
                 "SELECT id FROM characters WHERE name = ?",
@@ -421,23 +507,19 @@ def _save_review_to_database(config: Config, parsed_review: dict, media_info: di
             else:
                 character_id = char_row[0]
 
-            # Get media ID
-            media_id = media_info.get('id')
-            if not media_id:
-                console.print("[yellow]⚠️  Media not in database - review not saved[/yellow]")
-                return
-
-            # Save review
-            conn.execute(
+            # Save reviews
+            conn.executemany(
                 """
                 INSERT INTO critics (media_id, character_id, rating, content, generated_at)
                 VALUES (?, ?, ?, ?, datetime('now'))
                 """,
-                (media_id, character_id, parsed_review['rating'], parsed_review['content'])
+                [(media_id, character_id, review['rating'], review['content']) for review, media_id in pending]
             )
 
-            conn.commit()
+        if len(pending) == 1:
             console.print("[green]✅ Review saved to database[/green]")
+        else:
+            console.print(f"[green]✅ {len(pending)} reviews saved to database[/green]")
 
     except Exception as e:
         logger.error(f"Failed to save review: {str(e)}")
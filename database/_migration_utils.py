@@ -0,0 +1,111 @@
+"""
+Shared helpers for the database/migrate_*.py scripts.
+
+One place for the default database path, the existence check, the
+connection PRAGMAs and the BEGIN IMMEDIATE / COMMIT bracketing.
+
+The existence check lives in require_database(), called once by whichever
+entry point starts the run, not on every connect.
+"""
+
+import json
+import sqlite3
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+# The migration scripts run with database/ as sys.path[0]; the project root
+# makes the shared db_utils helpers importable from them
+sys.path.append(str(Path(__file__).parent.parent))
+
+DB_PATH = Path(__file__).parent / "critics.db"
+_DB_STR = str(DB_PATH)
+
+# WAL journal + relaxed fsync and a larger in-memory cache for bulk migration work.
+# journal_mode cannot change inside a transaction, so these run before BEGIN.
+_TUNING_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -65536;
+"""
+
+
+def require_database(path=None) -> str:
+    """Exit with an error unless the database file exists; returns its path as a string"""
+    path = str(path) if path else _DB_STR
+    if not Path(path).exists():
+        print(f"❌ Database not found: {path}")
+        sys.exit(1)
+    return path
+
+
+def connect_and_tune(path=None, foreign_keys: bool = False) -> sqlite3.Connection:
+    """Open the database in autocommit mode with the migration PRAGMAs applied"""
+    # Larger statement cache than the default 100 so a shared connection keeps
+    # every migration's prepared statements across run_all_migrations
+    conn = sqlite3.connect(path or _DB_STR, isolation_level=None, cached_statements=256)
+    conn.executescript(_TUNING_PRAGMAS)
+    if foreign_keys:
+        conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+def begin(conn: sqlite3.Connection):
+    """Start a write transaction, taking the write lock up front"""
+    conn.execute("BEGIN IMMEDIATE")
+
+
+def commit(conn: sqlite3.Connection):
+    conn.execute("COMMIT")
+
+
+def rollback(conn: sqlite3.Connection):
+    if conn.in_transaction:
+        conn.execute("ROLLBACK")
+
+
+@contextmanager
+def migration(path=None, foreign_keys: bool = False, conn: sqlite3.Connection = None):
+    """Yield a tuned connection inside one transaction; commit on success, roll back on error.
+
+    Pass conn (from connect_and_tune) to run on a shared connection, which
+    is left open for the next migration; otherwise one is opened and closed here.
+    """
+    owned = conn is None
+    if owned:
+        conn = connect_and_tune(path, foreign_keys)
+    else:
+        # Per-migration setting; can only change outside a transaction
+        conn.execute(f"PRAGMA foreign_keys = {'ON' if foreign_keys else 'OFF'}")
+    try:
+        begin(conn)
+        yield conn
+        commit(conn)
+    except Exception:
+        rollback(conn)
+        raise
+    finally:
+        if owned:
+            conn.close()
+
+
+def to_json(value) -> str:
+    """Serialize a list/dict for a TEXT column: real UTF-8, no padding after separators"""
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def emit(lines):
+    """Write collected progress lines in one go, once the transaction is over"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def add_column(conn: sqlite3.Connection, table: str, col: str, definition: str) -> bool:
+    """ALTER TABLE ... ADD COLUMN; returns False if the column already exists"""
+    try:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {col} {definition}")
+    except sqlite3.OperationalError as e:
+        if "duplicate column" not in str(e):
+            raise
+        return False
+    return True
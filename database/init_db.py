@@ -35,6 +35,9 @@ def init_database(db_path: str = "database/critics.db"):
         # Execute schema
         conn.executescript(schema_sql)
 
+        # Populate the FTS index from any pre-existing media rows
+        conn.execute("INSERT INTO media_fts(media_fts) VALUES('rebuild')")
+
         # Verify tables were created
         cursor = conn.cursor()
         cursor.execute("""
@@ -43,18 +46,17 @@ def init_database(db_path: str = "database/critics.db"):
             ORDER BY name
         """)
 
-        tables = [row[0] for row in cursor.fetchall()]
+        tables = [row[0] for row in cursor]
         print(f"✅ Created tables: {', '.join(tables)}")
 
-        # Get initial stats
-        cursor.execute("SELECT * FROM stats_summary")
-        stats = cursor.fetchone()
-        if stats:
-            print(f"📊 Initial stats: {stats[0]} media, {stats[3]} critics")
-
-        # Verify characters were inserted
-        cursor.execute("SELECT COUNT(*) FROM characters WHERE active = TRUE")
-        active_chars = cursor.fetchone()[0]
+        # Get initial stats and verify characters were inserted, in one read
+        cursor.execute("""
+            SELECT (SELECT COUNT(*) FROM characters WHERE active = TRUE) AS active_chars,
+                   total_media, total_critics
+            FROM stats_summary
+        """)
+        active_chars, total_media, total_critics = cursor.fetchone()
+        print(f"📊 Initial stats: {total_media} media, {total_critics} critics")
         print(f"🎭 Active characters: {active_chars}")
 
     print("🚀 Database initialized successfully!")
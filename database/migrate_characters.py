@@ -9,12 +9,11 @@ Migration: Implement full character roster for Parody Critics.
 Safe to run multiple times (idempotent via INSERT OR REPLACE).
 """
 
-import json
 import sqlite3
-import sys
-from pathlib import Path
 
-DB_PATH = Path(__file__).parent / "critics.db"
+from _migration_utils import DB_PATH, emit, migration, require_database, to_json
+from db_utils import indexes_deferred
+
 
 DEACTIVATE = ["el_cinefilo_snob", "karen_madrid"]
 
@@ -324,65 +323,52 @@ CHARACTERS = [
     },
 ]
 
+# Upsert column order; the JSON-typed ones are serialized once at import
+_COLUMNS = (
+    "id", "name", "emoji", "color", "border_color", "accent_color",
+    "personality", "description",
+    "motifs", "catchphrases", "avoid", "red_flags", "loves", "hates",
+    "active",
+)
+_JSON_COLUMNS = frozenset({"motifs", "catchphrases", "avoid", "red_flags", "loves", "hates"})
+
+# Statement text is fixed so sqlite3's statement cache reuses the compiled plan
+_DEACTIVATE_SQL = "UPDATE characters SET active = FALSE WHERE id = ?"
+_UPSERT_SQL = (
+    f"INSERT OR REPLACE INTO characters ({', '.join(_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(_COLUMNS))})"
+)
 
-def run_migration(db_path: str = None):
-    path = db_path or str(DB_PATH)
-    if not Path(path).exists():
-        print(f"Database not found: {path}")
-        sys.exit(1)
+# One tuple per column across CHARACTERS; zip(*_COLUMN_VALUES) yields the upsert rows
+_COLUMN_VALUES = tuple(
+    tuple(
+        to_json(char[col]) if col in _JSON_COLUMNS else char[col]
+        for char in CHARACTERS
+    )
+    for col in _COLUMNS
+)
 
-    print(f"Migrating database: {path}")
 
-    with sqlite3.connect(path) as conn:
-        conn.execute("PRAGMA foreign_keys = ON")
+def run_migration(db_path: str = None, conn: sqlite3.Connection = None):
+    with migration(db_path, foreign_keys=True, conn=conn) as conn:
         cursor = conn.cursor()
 
         # Deactivate retired characters
-        for char_id in DEACTIVATE:
-            cursor.execute("UPDATE characters SET active = FALSE WHERE id = ?", (char_id,))
-            print(f"  Deactivated: {char_id}")
-
-        # Upsert all characters in the new roster
-        for char in CHARACTERS:
-            cursor.execute(
-                """
-                INSERT OR REPLACE INTO characters (
-                    id, name, emoji, color, border_color, accent_color,
-                    personality, description,
-                    motifs, catchphrases, avoid, red_flags, loves, hates,
-                    active
-                ) VALUES (
-                    :id, :name, :emoji, :color, :border_color, :accent_color,
-                    :personality, :description,
-                    :motifs, :catchphrases, :avoid, :red_flags, :loves, :hates,
-                    :active
-                )
-                """,
-                {
-                    "id": char["id"],
-                    "name": char["name"],
-                    "emoji": char["emoji"],
-                    "color": char["color"],
-                    "border_color": char["border_color"],
-                    "accent_color": char["accent_color"],
-                    "personality": char["personality"],
-                    "description": char["description"],
-                    "motifs": json.dumps(char["motifs"], ensure_ascii=False),
-                    "catchphrases": json.dumps(char["catchphrases"], ensure_ascii=False),
-                    "avoid": json.dumps(char["avoid"], ensure_ascii=False),
-                    "red_flags": json.dumps(char["red_flags"], ensure_ascii=False),
-                    "loves": json.dumps(char["loves"], ensure_ascii=False),
-                    "hates": json.dumps(char["hates"], ensure_ascii=False),
-                    "active": char["active"],
-                },
-            )
-            action = "Updated" if char["id"] == "lebowsky" else "Inserted"
-            print(f"  {action}: {char['id']} ({char['personality']})")
+        cursor.executemany(_DEACTIVATE_SQL, ((char_id,) for char_id in DEACTIVATE))
 
-        conn.commit()
+        # Upsert all characters in the new roster; rows are pulled lazily from the zip
+        with indexes_deferred(conn, "characters", len(CHARACTERS)):
+            cursor.executemany(_UPSERT_SQL, zip(*_COLUMN_VALUES))
 
-    print("Migration complete.")
+    logs = [f"Migrating database: {db_path or DB_PATH}",
+            f"  Deactivated: {', '.join(DEACTIVATE)}"]
+    for char in CHARACTERS:
+        action = "Updated" if char["id"] == "lebowsky" else "Inserted"
+        logs.append(f"  {action}: {char['id']} ({char['personality']})")
+    logs.append("Migration complete.")
+    emit(logs)
 
 
 if __name__ == "__main__":
+    require_database()
     run_migration()
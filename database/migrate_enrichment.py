@@ -4,37 +4,25 @@ Migration: Add enriched_context column to media table.
 Safe to run multiple times (idempotent).
 """
 import sqlite3
-import sys
-from pathlib import Path
 
-DB_PATH = Path(__file__).parent / "critics.db"
+from _migration_utils import DB_PATH, add_column, emit, migration, require_database
 
-def run_migration(db_path: str = None):
-    path = db_path or str(DB_PATH)
-    if not Path(path).exists():
-        print(f"❌ Database not found: {path}")
-        sys.exit(1)
-
-    print(f"🗃️  Migrating database: {path}")
-
-    with sqlite3.connect(path) as conn:
-        cursor = conn.cursor()
-        cursor.execute("PRAGMA table_info(media)")
-        existing = {row[1] for row in cursor.fetchall()}
 
+def run_migration(db_path: str = None, conn: sqlite3.Connection = None):
+    logs = [f"🗃️  Migrating database: {db_path or DB_PATH}"]
+    with migration(db_path, conn=conn) as conn:
         for col, definition in [
             ("enriched_context", "TEXT"),
             ("enriched_at",      "DATETIME"),
         ]:
-            if col not in existing:
-                cursor.execute(f"ALTER TABLE media ADD COLUMN {col} {definition}")
-                print(f"  ✅ Added column: {col}")
+            if add_column(conn, "media", col, definition):
+                logs.append(f"  ✅ Added column: {col}")
             else:
-                print(f"  ⏭️  Already exists: {col}")
-
-        conn.commit()
+                logs.append(f"  ⏭️  Already exists: {col}")
 
-    print("🚀 Migration complete!")
+    logs.append("🚀 Migration complete!")
+    emit(logs)
 
 if __name__ == "__main__":
+    require_database()
     run_migration()
@@ -6,11 +6,10 @@ Migration: Refine Mark Hamill + remove test_character.
 - test_character: deleted
 """
 
-import json
 import sqlite3
-from pathlib import Path
 
-DB_PATH = Path(__file__).parent / "critics.db"
+from _migration_utils import emit, migration, require_database, to_json
+
 
 HAMILL_DESCRIPTION = (
     "Eres Mark Hamill, actor icónico y voz legendaria. Amas el cine con pasión genuina, "
@@ -56,9 +55,15 @@ HAMILL_RED_FLAGS = [
     "Luke Skywalker caracterizado como fracasado y amargado",
 ]
 
+# JSON payloads serialized once at import
+_LOVES_JSON = to_json(HAMILL_LOVES)
+_HATES_JSON = to_json(HAMILL_HATES)
+_MOTIFS_JSON = to_json(HAMILL_MOTIFS)
+_RED_FLAGS_JSON = to_json(HAMILL_RED_FLAGS)
+
 
-def run_migration():
-    with sqlite3.connect(DB_PATH) as conn:
+def run_migration(db_path: str = None, conn: sqlite3.Connection = None):
+    with migration(db_path, conn=conn) as conn:
         conn.execute(
             """
             UPDATE characters SET
@@ -70,23 +75,13 @@ def run_migration():
                 personality = 'nostalgico'
             WHERE id = 'mark_hamill'
             """,
-            (
-                HAMILL_DESCRIPTION,
-                json.dumps(HAMILL_LOVES, ensure_ascii=False),
-                json.dumps(HAMILL_HATES, ensure_ascii=False),
-                json.dumps(HAMILL_MOTIFS, ensure_ascii=False),
-                json.dumps(HAMILL_RED_FLAGS, ensure_ascii=False),
-            ),
+            (HAMILL_DESCRIPTION, _LOVES_JSON, _HATES_JSON, _MOTIFS_JSON, _RED_FLAGS_JSON),
         )
-        print("  Updated: mark_hamill")
-
         conn.execute("DELETE FROM characters WHERE id = 'test_character'")
-        print("  Deleted: test_character")
-
-        conn.commit()
 
-    print("Migration complete.")
+    emit(["  Updated: mark_hamill", "  Deleted: test_character", "Migration complete."])
 
 
 if __name__ == "__main__":
+    require_database()
     run_migration()
@@ -7,11 +7,9 @@ Safe to run multiple times (idempotent).
 """
 
 import sqlite3
-import json
-import sys
-from pathlib import Path
 
-DB_PATH = Path(__file__).parent / "critics.db"
+from _migration_utils import DB_PATH, add_column, emit, migration, require_database, to_json
+
 
 BACKFILL_DATA = {
     "marco_aurelio": {
@@ -96,22 +94,41 @@ BACKFILL_DATA = {
 }
 
 
-def run_migration(db_path: str = None):
-    path = db_path or str(DB_PATH)
-    if not Path(path).exists():
-        print(f"❌ Database not found: {path}")
-        sys.exit(1)
-
-    print(f"🗃️  Migrating database: {path}")
-
-    with sqlite3.connect(path) as conn:
-        conn.execute("PRAGMA foreign_keys = ON")
+# Motif history table and its indexes. Run one by one rather than via
+# executescript(), which would COMMIT the open BEGIN IMMEDIATE transaction.
+_MOTIF_HISTORY_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS character_motif_history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        character_id TEXT NOT NULL,
+        motif TEXT NOT NULL,
+        used_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        FOREIGN KEY (character_id) REFERENCES characters(id) ON DELETE CASCADE
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_motif_history_character ON character_motif_history(character_id)",
+    "CREATE INDEX IF NOT EXISTS idx_motif_history_used_at ON character_motif_history(used_at)",
+)
+
+# Backfill parameters as (motifs, catchphrases, avoid, red_flags, id): one
+# tuple per column, JSON serialized once at import. zip(*_BACKFILL_VALUES)
+# yields the rows lazily, so executemany never needs a materialized list.
+_BACKFILL_COLUMNS = ("motifs", "catchphrases", "avoid", "red_flags")
+_BACKFILL_VALUES = (
+    *(
+        tuple(to_json(data[col]) for data in BACKFILL_DATA.values())
+        for col in _BACKFILL_COLUMNS
+    ),
+    tuple(BACKFILL_DATA),
+)
+
+
+def run_migration(db_path: str = None, conn: sqlite3.Connection = None):
+    logs = [f"🗃️  Migrating database: {db_path or DB_PATH}"]
+    with migration(db_path, foreign_keys=True, conn=conn) as conn:
         cursor = conn.cursor()
 
         # --- Add columns if they don't exist ---
-        cursor.execute("PRAGMA table_info(characters)")
-        existing_cols = {row[1] for row in cursor.fetchall()}
-
         new_cols = {
             "motifs": "TEXT DEFAULT '[]'",
             "catchphrases": "TEXT DEFAULT '[]'",
@@ -120,63 +137,30 @@ def run_migration(db_path: str = None):
         }
 
         for col, definition in new_cols.items():
-            if col not in existing_cols:
-                cursor.execute(f"ALTER TABLE characters ADD COLUMN {col} {definition}")
-                print(f"  ✅ Added column: {col}")
+            if add_column(conn, "characters", col, definition):
+                logs.append(f"  ✅ Added column: {col}")
             else:
-                print(f"  ⏭️  Column already exists: {col}")
-
-        # --- Create motif history table ---
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS character_motif_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                character_id TEXT NOT NULL,
-                motif TEXT NOT NULL,
-                used_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (character_id) REFERENCES characters(id) ON DELETE CASCADE
-            )
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_motif_history_character
-            ON character_motif_history(character_id)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_motif_history_used_at
-            ON character_motif_history(used_at)
-        """)
-        print("  ✅ Table character_motif_history ready")
-
-        # --- Backfill existing characters ---
-        for char_id, data in BACKFILL_DATA.items():
-            cursor.execute("SELECT id, motifs FROM characters WHERE id = ?", (char_id,))
-            row = cursor.fetchone()
-            if not row:
-                print(f"  ⏭️  Character not found, skipping: {char_id}")
-                continue
-
-            # Only backfill if motifs is empty/null
-            current_motifs = row[1]
-            if current_motifs and current_motifs != '[]':
-                print(f"  ⏭️  Already has motifs, skipping: {char_id}")
-                continue
-
-            cursor.execute("""
-                UPDATE characters
-                SET motifs = ?, catchphrases = ?, avoid = ?, red_flags = ?
-                WHERE id = ?
-            """, (
-                json.dumps(data["motifs"], ensure_ascii=False),
-                json.dumps(data["catchphrases"], ensure_ascii=False),
-                json.dumps(data["avoid"], ensure_ascii=False),
-                json.dumps(data["red_flags"], ensure_ascii=False),
-                char_id
-            ))
-            print(f"  ✅ Backfilled: {char_id}")
-
-        conn.commit()
-
-    print("🚀 Migration complete!")
+                logs.append(f"  ⏭️  Column already exists: {col}")
+
+        # --- Create motif history table + indexes (same transaction) ---
+        for ddl in _MOTIF_HISTORY_DDL:
+            cursor.execute(ddl)
+        logs.append("  ✅ Table character_motif_history ready")
+
+        # --- Backfill existing characters (only those whose motifs are still empty) ---
+        cursor.executemany("""
+            UPDATE characters
+            SET motifs = ?, catchphrases = ?, avoid = ?, red_flags = ?
+            WHERE id = ? AND (motifs IS NULL OR motifs = '' OR motifs = '[]')
+        """, zip(*_BACKFILL_VALUES))
+        backfilled = cursor.rowcount
+        logs.append(f"  ✅ Backfilled: {backfilled} character(s), "
+                    f"{len(BACKFILL_DATA) - backfilled} missing or already populated")
+
+    logs.append("🚀 Migration complete!")
+    emit(logs)
 
 
 if __name__ == "__main__":
+    require_database()
     run_migration()
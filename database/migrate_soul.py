@@ -2,11 +2,10 @@
 Backfill loves/hates soul fields for existing characters.
 Idempotent — safe to run multiple times.
 """
-import json
 import sqlite3
-from pathlib import Path
 
-DB_PATH = Path(__file__).parent / "critics.db"
+from _migration_utils import add_column, emit, migration, require_database, to_json
+
 
 SOUL_DATA = {
     "marco_aurelio": {
@@ -28,42 +27,34 @@ SOUL_DATA = {
 }
 
 
-def run():
-    conn = sqlite3.connect(str(DB_PATH))
-    try:
-        existing_cols = {r[1] for r in conn.execute("PRAGMA table_info(characters)").fetchall()}
+# UPDATE parameters (loves, hates, id) as one tuple per column, serialized
+# once at import; zip(*_SOUL_VALUES) yields the rows lazily
+_SOUL_VALUES = (
+    tuple(to_json(soul["loves"]) for soul in SOUL_DATA.values()),
+    tuple(to_json(soul["hates"]) for soul in SOUL_DATA.values()),
+    tuple(SOUL_DATA),
+)
+
 
+def run(db_path: str = None, conn: sqlite3.Connection = None):
+    logs = []
+    with migration(db_path, conn=conn) as conn:
         # Add columns if not present
         for col in ("loves", "hates"):
-            if col not in existing_cols:
-                conn.execute(f"ALTER TABLE characters ADD COLUMN {col} TEXT DEFAULT '[]'")
-                print(f"Added column: {col}")
-
-        existing_ids = {r[0] for r in conn.execute("SELECT id FROM characters").fetchall()}
+            if add_column(conn, "characters", col, "TEXT DEFAULT '[]'"):
+                logs.append(f"Added column: {col}")
 
-        updated = 0
-        skipped = 0
-        for char_id, soul in SOUL_DATA.items():
-            if char_id not in existing_ids:
-                print(f"  Skipping {char_id} — not found in DB")
-                skipped += 1
-                continue
-            conn.execute(
-                "UPDATE characters SET loves = ?, hates = ? WHERE id = ?",
-                (
-                    json.dumps(soul["loves"], ensure_ascii=False),
-                    json.dumps(soul["hates"], ensure_ascii=False),
-                    char_id,
-                ),
-            )
-            print(f"  Updated {char_id}: {len(soul['loves'])} loves, {len(soul['hates'])} hates")
-            updated += 1
+        # Characters missing from the DB simply match no row
+        updated = conn.executemany(
+            "UPDATE characters SET loves = ?, hates = ? WHERE id = ?",
+            zip(*_SOUL_VALUES),
+        ).rowcount
+        skipped = len(SOUL_DATA) - updated
 
-        conn.commit()
-        print(f"\nDone: {updated} updated, {skipped} skipped")
-    finally:
-        conn.close()
+    logs.append(f"\nDone: {updated} updated, {skipped} skipped")
+    emit(logs)
 
 
 if __name__ == "__main__":
+    require_database()
     run()
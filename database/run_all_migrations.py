@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Run every database/migrate_*.py script in dependency order on ONE connection.
+
+The connection is opened and tuned once and shared by all migrations, so the
+page cache stays warm between them. Each migration still commits in its own
+transaction, and all of them are idempotent, so a rerun after a failure
+picks up where it stopped.
+
+Usage: python database/run_all_migrations.py [path/to/critics.db]
+"""
+
+import sys
+
+import migrate_characters
+import migrate_enrichment
+import migrate_hamill_fix
+import migrate_personality
+import migrate_soul
+from _migration_utils import connect_and_tune, require_database
+
+# Column-adding migrations first: the character roster and the Hamill fix
+# write the motifs/loves/hates columns the earlier steps create.
+MIGRATIONS = (
+    ("enrichment", migrate_enrichment.run_migration),
+    ("personality", migrate_personality.run_migration),
+    ("soul", migrate_soul.run),
+    ("characters", migrate_characters.run_migration),
+    ("hamill_fix", migrate_hamill_fix.run_migration),
+)
+
+
+def run_all(db_path: str = None):
+    db_path = require_database(db_path)
+    conn = connect_and_tune(db_path)
+    try:
+        for name, run in MIGRATIONS:
+            print(f"▶️  {name}")
+            run(db_path, conn=conn)
+    finally:
+        conn.close()
+    print(f"✅ {len(MIGRATIONS)} migrations applied")
+
+
+if __name__ == "__main__":
+    run_all(sys.argv[1] if len(sys.argv) > 1 else None)
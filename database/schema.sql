@@ -99,6 +99,7 @@ CREATE INDEX IF NOT EXISTS idx_media_tmdb ON media(tmdb_id);
 CREATE INDEX IF NOT EXISTS idx_media_jellyfin ON media(jellyfin_id);
 CREATE INDEX IF NOT EXISTS idx_media_type ON media(type);
 CREATE INDEX IF NOT EXISTS idx_media_year ON media(year);
+CREATE INDEX IF NOT EXISTS idx_media_title_cover ON media(title, year, type); -- rowid (id) va implícito
 CREATE INDEX IF NOT EXISTS idx_critics_media ON critics(media_id);
 CREATE INDEX IF NOT EXISTS idx_critics_character ON critics(character_id);
 CREATE INDEX IF NOT EXISTS idx_sync_log_type ON sync_log(sync_type);
@@ -517,6 +518,31 @@ CREATE TRIGGER IF NOT EXISTS update_media_timestamp
         UPDATE media SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
     END;
 
+-- Índice de búsqueda de texto completo (FTS5) sobre título y géneros
+CREATE VIRTUAL TABLE IF NOT EXISTS media_fts USING fts5(
+    title, genres, content='media', content_rowid='id'
+);
+
+-- Triggers para mantener media_fts sincronizado con media
+CREATE TRIGGER IF NOT EXISTS media_fts_insert
+    AFTER INSERT ON media
+    BEGIN
+        INSERT INTO media_fts(rowid, title, genres) VALUES (NEW.id, NEW.title, NEW.genres);
+    END;
+
+CREATE TRIGGER IF NOT EXISTS media_fts_delete
+    AFTER DELETE ON media
+    BEGIN
+        INSERT INTO media_fts(media_fts, rowid, title, genres) VALUES ('delete', OLD.id, OLD.title, OLD.genres);
+    END;
+
+CREATE TRIGGER IF NOT EXISTS media_fts_update
+    AFTER UPDATE OF title, genres ON media
+    BEGIN
+        INSERT INTO media_fts(media_fts, rowid, title, genres) VALUES ('delete', OLD.id, OLD.title, OLD.genres);
+        INSERT INTO media_fts(rowid, title, genres) VALUES (NEW.id, NEW.title, NEW.genres);
+    END;
+
 -- Vista para estadísticas rápidas
 CREATE VIEW IF NOT EXISTS stats_summary AS
 SELECT
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+🎭 Parody Critics - SQLite helpers for the standalone scripts
+(init_database.py, full_sync.py, run_setup.py, scripts/jellyfin_sync.py)
+and the database/migrate_*.py migrations
+"""
+
+import sqlite3
+from contextlib import contextmanager
+
+# WAL lets the count/status reads run alongside a writer, NORMAL syncs only at
+# checkpoints, and busy_timeout waits on a locked database instead of failing.
+# journal_mode=WAL is persistent on the file once set.
+_CONNECT_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA busy_timeout = 5000;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -20000;
+"""
+
+
+def open_db(db_path, **connect_kwargs) -> sqlite3.Connection:
+    """Open the database with the standard PRAGMAs applied.
+
+    Keeps sqlite3's default transaction handling, so ``with open_db(...) as conn``
+    still commits everything in the block at once. Extra keyword arguments go
+    to sqlite3.connect().
+    """
+    conn = sqlite3.connect(str(db_path), **connect_kwargs)
+    conn.executescript(_CONNECT_PRAGMAS)
+    return conn
+
+
+# Below this many rows, per-row index maintenance is cheaper than rebuilding
+BULK_INDEX_THRESHOLD = 100
+
+
+@contextmanager
+def indexes_deferred(conn: sqlite3.Connection, table: str, row_count: int):
+    """Drop the table's secondary indexes around a bulk write and rebuild them afterwards.
+
+    A no-op below BULK_INDEX_THRESHOLD rows. Must run inside the write
+    transaction: on error the ROLLBACK restores the dropped indexes.
+    """
+    if row_count < BULK_INDEX_THRESHOLD:
+        yield
+        return
+
+    # sql IS NULL for automatic indexes (PRIMARY KEY / UNIQUE), which can't be dropped
+    indexes = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+        (table,),
+    ).fetchall()
+    for name, _ in indexes:
+        conn.execute(f'DROP INDEX "{name}"')
+    yield
+    for _, sql in indexes:
+        conn.execute(sql)
@@ -3,8 +3,18 @@
 Full sync script for Parody Critics - sync all media from Jellyfin
 """
 import asyncio
+import logging
+import sys
 from api.jellyfin_sync import JellyfinSyncManager
 from config import get_config
+from db_utils import open_db
+
+# Plain stdlib logger: api.jellyfin_sync already configures root logging at import,
+# and a parody_critics logger would propagate there and print everything twice
+logger = logging.getLogger("full_sync")
+
+# Fixed statement text for the before/after counts, so both hit sqlite3's statement cache
+_MEDIA_COUNT_SQL = "SELECT COUNT(*) FROM media"
 
 async def main():
     """Execute full sync of all Jellyfin media"""
@@ -12,36 +22,41 @@ async def main():
 
     # Get configuration
     config = get_config()
+    db_path = config.get_absolute_db_path()
 
     # Initialize sync manager
     sync_manager = JellyfinSyncManager(
         jellyfin_url=config.JELLYFIN_URL,
         api_token=config.JELLYFIN_API_TOKEN,
         jellyfin_db_path=config.JELLYFIN_DB_PATH,
-        local_db_path=config.get_absolute_db_path()
+        local_db_path=db_path
     )
 
     print("📊 Configuration loaded:")
     print(f"   Jellyfin URL: {config.JELLYFIN_URL}")
     print(f"   Jellyfin DB: {config.JELLYFIN_DB_PATH}")
-    print(f"   Local DB: {config.get_absolute_db_path()}")
+    print(f"   Local DB: {db_path}")
     print(f"   Batch size: {config.SYNC_BATCH_SIZE}")
 
+    # One local connection for the before/after counts; the sync manager writes through its own.
+    # uri=True lets it ATTACH the Jellyfin DB read-only; the first count runs in a worker
+    # thread, one statement at a time, hence check_same_thread=False.
+    conn = open_db(db_path, uri=True, check_same_thread=False)
+    count_stmt = conn.cursor()
+
+    def local_media_count() -> int:
+        return count_stmt.execute(_MEDIA_COUNT_SQL).fetchone()[0]
+
     try:
-        # Get current stats
-        jellyfin_counts = sync_manager.get_media_count_from_jellyfin_db()
+        # Get current stats: Jellyfin and local counts in one statement, Jellyfin DB attached
+        jellyfin_counts, local_count = await asyncio.to_thread(
+            sync_manager.get_media_counts_with_local, conn
+        )
         print("\n📈 Jellyfin Media Stats:")
         print(f"   Movies: {jellyfin_counts['movies']:,}")
         print(f"   Series: {jellyfin_counts['series']:,}")
         print(f"   Total: {jellyfin_counts['total']:,}")
 
-        # Check current local count
-        import sqlite3
-        with sqlite3.connect(config.get_absolute_db_path()) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM media")
-            local_count = cursor.fetchone()[0]
-
         print(f"   Local synced: {local_count:,}")
         print(f"   Remaining: {jellyfin_counts['total'] - local_count:,}")
 
@@ -51,42 +66,51 @@ async def main():
 
         # Start full sync
         print(f"\n🚀 Starting full sync with batch size {config.SYNC_BATCH_SIZE}...")
-        sync_id = await sync_manager.start_sync(
+        sync_task = asyncio.create_task(sync_manager.start_sync(
             sync_type="full",
             batch_size=config.SYNC_BATCH_SIZE
-        )
-
-        print(f"📝 Sync started with ID: {sync_id}")
+        ))
 
-        # Monitor progress
+        # Monitor progress: wake on each batch the sync manager reports,
+        # or every 5 seconds. One status line rewritten in place with \r,
+        # and only when its text changes.
+        last_msg = ""
         while True:
-            await asyncio.sleep(2)  # Check every 2 seconds
+            await sync_manager.wait_for_progress(timeout=5)
             progress = sync_manager.get_sync_progress()
 
             if not progress:
-                print("❌ Sync progress not available")
-                break
+                if sync_task.done():
+                    sys.stdout.write("\n❌ Sync progress not available\n")
+                    break
+                continue
 
             status = progress.get('status', 'unknown')
-            processed = progress.get('processed', 0)
-            total = progress.get('total', 0)
+            processed = progress.get('processed_items', 0)
+            total = progress.get('total_items', 0)
 
             if total > 0:
                 percent = (processed / total) * 100
-                print(f"⏳ Progress: {processed:,}/{total:,} ({percent:.1f}%) - Status: {status}")
+                msg = f"⏳ Progress: {processed:,}/{total:,} ({percent:.1f}%) - Status: {status}"
             else:
-                print(f"⏳ Status: {status} - Processed: {processed:,}")
+                msg = f"⏳ Status: {status} - Processed: {processed:,}"
+
+            if msg != last_msg:
+                # Pad to the previous length so a shorter line fully overwrites it
+                sys.stdout.write(f"\r{msg:<{len(last_msg)}}")
+                sys.stdout.flush()
+                last_msg = msg
 
             if status in ['completed', 'cancelled', 'failed']:
                 break
 
+        sys.stdout.write("\n")
+        sync_id = await sync_task
+
         # Final stats
-        with sqlite3.connect(config.get_absolute_db_path()) as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM media")
-            final_count = cursor.fetchone()[0]
+        final_count = local_media_count()
 
-        print("\n🎉 Sync completed!")
+        print(f"\n🎉 Sync {sync_id} completed!")
         print(f"   Final local count: {final_count:,}")
         print(f"   Sync coverage: {(final_count/jellyfin_counts['total']*100):.1f}%")
 
@@ -96,10 +120,12 @@ async def main():
             remaining = jellyfin_counts['total'] - final_count
             print(f"⚠️  Still missing {remaining:,} items")
 
-    except Exception as e:
-        print(f"❌ Sync failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("❌ Sync failed")
+    finally:
+        conn.close()
 
 if __name__ == "__main__":
+    # Keep failure tracebacks short
+    sys.tracebacklimit = 10
     asyncio.run(main())
\ No newline at end of file
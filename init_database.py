@@ -4,17 +4,36 @@
 Initialize database with schema and default characters
 """
 
+import json
 import sqlite3
 from pathlib import Path
 import sys
 
 from utils import setup_logging, get_logger
 from config import Config
+from db_utils import open_db
 
 # Setup logging
 setup_logging()
 logger = get_logger('init_db')
 
+# Table names per database path, read from sqlite_master once per process
+_TABLES_CACHE: dict = {}
+
+_TABLE_NAMES_SQL = "SELECT name FROM sqlite_master WHERE type='table'"
+_CHARACTER_NAMES_SQL = "SELECT name FROM characters"
+
+
+def _existing_tables(conn: sqlite3.Connection, db_path: str) -> frozenset:
+    """Names of the tables in db_path, cached after the first lookup"""
+    tables = _TABLES_CACHE.get(db_path)
+    if tables is None:
+        tables = frozenset(
+            row[0] for row in conn.execute(_TABLE_NAMES_SQL)
+        )
+        _TABLES_CACHE[db_path] = tables
+    return tables
+
 
 def create_database_schema(db_path: str):
     """Create database tables if they don't exist - Skip if already exist"""
@@ -24,12 +43,9 @@ def create_database_schema(db_path: str):
     # Ensure directory exists
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
-    with sqlite3.connect(db_path) as conn:
+    with open_db(db_path) as conn:
         # Check if tables exist
-        cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        existing_tables = [row[0] for row in cursor.fetchall()]
-
-        if 'media' in existing_tables:
+        if 'media' in _existing_tables(conn, db_path):
             logger.info("✅ Database schema already exists - skipping creation")
             return
 
@@ -37,10 +53,11 @@ def create_database_schema(db_path: str):
 
         # This would create the schema, but since it already exists, we skip
         # The actual schema is already created in the existing database
+        _TABLES_CACHE.pop(db_path, None)
         logger.info("✅ Database schema ready")
 
 
-def insert_default_characters(db_path: str):
+def insert_default_characters(conn: sqlite3.Connection):
     """Insert default critic characters"""
 
     logger.info("Inserting default characters")
@@ -70,124 +87,160 @@ def insert_default_characters(db_path: str):
         }
     ]
 
-    with sqlite3.connect(db_path) as conn:
-        for char in characters:
-            try:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO characters (id, name, emoji, color, border_color, accent_color,
-                                                    personality, description, prompt_template, active)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (char['id'], char['name'], char['emoji'], char['color'], char['border_color'],
-                     char['accent_color'], char['personality'], char['description'], char['prompt_template'], True)
-                )
-                logger.info(f"✅ Inserted character: {char['name']}")
-            except sqlite3.Error as e:
-                logger.error(f"❌ Failed to insert character {char['name']}: {str(e)}")
-
-        conn.commit()
+    ids = [char['id'] for char in characters]
+
+    # One executemany in one transaction: a single commit for all rows.
+    # Characters already in the table are left alone, so a rerun writes nothing.
+    with conn:
+        try:
+            existing = {row[0] for row in conn.execute(
+                f"SELECT id FROM characters WHERE id IN ({', '.join('?' * len(ids))})", ids
+            )}
+            missing = [char for char in characters if char['id'] not in existing]
+            if not missing:
+                logger.info("⏭️ Default characters already present")
+                return
+
+            conn.executemany(
+                """
+                INSERT INTO characters (id, name, emoji, color, border_color, accent_color,
+                                        personality, description, prompt_template, active)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO NOTHING
+                """,
+                ((char['id'], char['name'], char['emoji'], char['color'], char['border_color'],
+                  char['accent_color'], char['personality'], char['description'], char['prompt_template'], True)
+                 for char in missing)
+            )
+        except sqlite3.Error as e:
+            # Returning out of `with conn` would commit the partial batch
+            conn.rollback()
+            logger.error(f"❌ Failed to insert default characters: {str(e)}")
+            return
+
+        logger.info(f"✅ Inserted characters: {', '.join(char['name'] for char in missing)}")
         logger.info("✅ Default characters inserted successfully")
 
 
-def insert_sample_media(db_path: str):
+SAMPLE_MEDIA = [
+    {
+        'title': 'The Matrix',
+        'year': 1999,
+        'type': 'movie',
+        'genres': ['Action', 'Sci-Fi'],
+        'overview': 'A computer hacker learns from mysterious rebels about the true nature of his reality and his role in the war against its controllers.',
+        'runtime': 136,
+        'vote_average': 8.7
+    },
+    {
+        'title': 'Breaking Bad',
+        'year': 2008,
+        'type': 'series',
+        'genres': ['Crime', 'Drama', 'Thriller'],
+        'overview': 'A high school chemistry teacher diagnosed with inoperable lung cancer turns to manufacturing and selling methamphetamine.',
+        'runtime': 47,
+        'vote_average': 9.5
+    },
+    {
+        'title': 'Parasite',
+        'year': 2019,
+        'type': 'movie',
+        'genres': ['Drama', 'Thriller', 'Comedy'],
+        'overview': 'A poor family schemes to become employed by a wealthy family and infiltrate their household.',
+        'runtime': 132,
+        'vote_average': 8.6
+    }
+]
+
+
+def _sample_media_rows() -> dict:
+    """INSERT parameters for SAMPLE_MEDIA keyed by tmdb_id, genres as compact JSON"""
+    rows = {}
+    for media in SAMPLE_MEDIA:
+        slug = media['title'].replace(' ', '_').lower()
+        rows[f"tmdb_{slug}"] = (f"tmdb_{slug}", f"jf_{slug}_001",
+                                media['title'], media['year'], media['type'],
+                                json.dumps(media['genres'], separators=(',', ':')),
+                                media['overview'], media['runtime'], media['vote_average'])
+    return rows
+
+
+# Built once at import
+_SAMPLE_MEDIA_ROWS = _sample_media_rows()
+
+
+def insert_sample_media(conn: sqlite3.Connection):
     """Insert some sample media for testing"""
 
     logger.info("Inserting sample media")
 
-    sample_media = [
-        {
-            'title': 'The Matrix',
-            'year': 1999,
-            'type': 'movie',
-            'genres': '["Action", "Sci-Fi"]',
-            'overview': 'A computer hacker learns from mysterious rebels about the true nature of his reality and his role in the war against its controllers.',
-            'runtime': 136,
-            'vote_average': 8.7
-        },
-        {
-            'title': 'Breaking Bad',
-            'year': 2008,
-            'type': 'series',
-            'genres': '["Crime", "Drama", "Thriller"]',
-            'overview': 'A high school chemistry teacher diagnosed with inoperable lung cancer turns to manufacturing and selling methamphetamine.',
-            'runtime': 47,
-            'vote_average': 9.5
-        },
-        {
-            'title': 'Parasite',
-            'year': 2019,
-            'type': 'movie',
-            'genres': '["Drama", "Thriller", "Comedy"]',
-            'overview': 'A poor family schemes to become employed by a wealthy family and infiltrate their household.',
-            'runtime': 132,
-            'vote_average': 8.6
-        }
-    ]
+    # Skip the write transaction entirely when every sample is already there
+    with conn:
+        try:
+            existing = {row[0] for row in conn.execute(
+                f"SELECT tmdb_id FROM media WHERE tmdb_id IN ({', '.join('?' * len(_SAMPLE_MEDIA_ROWS))})",
+                list(_SAMPLE_MEDIA_ROWS)
+            )}
+            missing = [row for tmdb_id, row in _SAMPLE_MEDIA_ROWS.items() if tmdb_id not in existing]
+            if not missing:
+                logger.info("⏭️ Sample media already present")
+                return
+
+            conn.executemany(
+                """
+                INSERT INTO media (tmdb_id, jellyfin_id, title, year, type, genres, overview, runtime, vote_average)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT DO NOTHING
+                """,
+                missing
+            )
+        except sqlite3.Error as e:
+            # Returning out of `with conn` would commit the partial batch
+            conn.rollback()
+            logger.error(f"❌ Failed to insert sample media: {str(e)}")
+            return
 
-    with sqlite3.connect(db_path) as conn:
-        for media in sample_media:
-            try:
-                conn.execute(
-                    """
-                    INSERT OR IGNORE INTO media (tmdb_id, jellyfin_id, title, year, type, genres, overview, runtime, vote_average)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (f"tmdb_{media['title'].replace(' ', '_').lower()}",
-                     f"jf_{media['title'].replace(' ', '_').lower()}_001",
-                     media['title'], media['year'], media['type'], media['genres'],
-                     media['overview'], media['runtime'], media['vote_average'])
-                )
-                logger.info(f"✅ Inserted media: {media['title']}")
-            except sqlite3.Error as e:
-                logger.error(f"❌ Failed to insert media {media['title']}: {str(e)}")
-
-        conn.commit()
+        logger.info(f"✅ Inserted media: {', '.join(row[2] for row in missing)}")
         logger.info("✅ Sample media inserted successfully")
 
 
-def check_database_status(db_path: str):
+def check_database_status(conn: sqlite3.Connection, db_path: str):
     """Check and display database status"""
 
     logger.info("Checking database status")
 
     try:
-        with sqlite3.connect(db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        # Count tables
+        tables = _existing_tables(conn, db_path)
 
-            # Count tables
-            cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row['name'] for row in cursor.fetchall()]
+        print(f"\n📊 Database Status: {db_path}")
+        print(f"📋 Tables: {len(tables)}")
 
-            print(f"\n📊 Database Status: {db_path}")
-            print(f"📋 Tables: {len(tables)}")
+        # All row counts in one UNION ALL statement (one (table, count) row each),
+        # built over whichever tables exist
+        counted = [table for table in ('media', 'critics', 'sync_log') if table in tables]
+        counts = {}
+        if counted:
+            counts = dict(conn.execute(
+                " UNION ALL ".join(f"SELECT '{table}', COUNT(*) FROM {table}" for table in counted)
+            ))
 
-            if 'media' in tables:
-                cursor = conn.execute("SELECT COUNT(*) as count FROM media")
-                media_count = cursor.fetchone()['count']
-                print(f"🎬 Media items: {media_count}")
+        if 'media' in counts:
+            print(f"🎬 Media items: {counts['media']}")
 
-            if 'characters' in tables:
-                cursor = conn.execute("SELECT COUNT(*) as count FROM characters")
-                char_count = cursor.fetchone()['count']
-                print(f"👥 Characters: {char_count}")
+        if 'characters' in tables:
+            # The name list gives the count too
+            char_names = [name for (name,) in conn.execute(_CHARACTER_NAMES_SQL)]
+            print(f"👥 Characters: {len(char_names)}")
+            print(f"   Characters: {', '.join(char_names)}")
 
-                # Show character names
-                cursor = conn.execute("SELECT name FROM characters")
-                char_names = [row['name'] for row in cursor.fetchall()]
-                print(f"   Characters: {', '.join(char_names)}")
+        if 'critics' in counts:
+            print(f"📝 Reviews: {counts['critics']}")
 
-            if 'critics' in tables:
-                cursor = conn.execute("SELECT COUNT(*) as count FROM critics")
-                critics_count = cursor.fetchone()['count']
-                print(f"📝 Reviews: {critics_count}")
+        if 'sync_log' in counts:
+            print(f"🔄 Sync logs: {counts['sync_log']}")
 
-            if 'sync_log' in tables:
-                cursor = conn.execute("SELECT COUNT(*) as count FROM sync_log")
-                sync_count = cursor.fetchone()['count']
-                print(f"🔄 Sync logs: {sync_count}")
-
-            print("✅ Database is ready!")
+        print("✅ Database is ready!")
 
     except sqlite3.Error as e:
         logger.error(f"❌ Database check failed: {str(e)}")
@@ -206,12 +259,17 @@ def main():
         # Create schema
         create_database_schema(db_path)
 
-        # Insert default data
-        insert_default_characters(db_path)
-        insert_sample_media(db_path)
-
-        # Check status
-        check_database_status(db_path)
+        # One connection for the data inserts and the status check
+        conn = open_db(db_path)
+        try:
+            # Insert default data
+            insert_default_characters(conn)
+            insert_sample_media(conn)
+
+            # Check status
+            check_database_status(conn, db_path)
+        finally:
+            conn.close()
 
         print("\n🎉 Database initialization completed successfully!")
         print("\nNext steps:")
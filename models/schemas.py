@@ -2,6 +2,7 @@
 Pydantic models for the Parody Critics API
 """
 
+from dataclasses import dataclass
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, List
 from datetime import datetime
@@ -135,8 +136,13 @@ class GenerationResponse(BaseModel):
     details: Optional[Dict] = None
 
 # Database Models (for internal use)
+# Plain slotted, frozen, keyword-only dataclasses: transport-only shapes of the
+# table rows. Nothing is validated on construction (the database's own CHECK
+# constraints guard the stored values), and the write paths insert parameter
+# tuples directly rather than going through these classes.
 
-class MediaDB(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class MediaDB:
     """Internal media model matching database schema"""
     id: Optional[int] = None
     tmdb_id: str
@@ -156,12 +162,13 @@ class MediaDB(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-class CriticDB(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class CriticDB:
     """Internal critic model matching database schema"""
     id: Optional[int] = None
     media_id: int
     character_id: str
-    rating: int = Field(ge=1, le=10)
+    rating: int  # 1-10
     content: str
     preview_length: int = 300
     generated_at: Optional[datetime] = None
@@ -169,7 +176,8 @@ class CriticDB(BaseModel):
     generation_prompt: Optional[str] = None
     tokens_used: Optional[int] = None
 
-class CharacterDB(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class CharacterDB:
     """Internal character model matching database schema"""
     id: str
     name: str
@@ -187,4 +195,4 @@ class CharacterDB(BaseModel):
     avoid: Optional[str] = '[]'         # JSON array string
     red_flags: Optional[str] = '[]'     # JSON array string
     loves: Optional[str] = '[]'         # JSON array string
-    hates: Optional[str] = '[]'         # JSON array string
\ No newline at end of file
+    hates: Optional[str] = '[]'         # JSON array string
@@ -9,12 +9,12 @@ import subprocess
 from pathlib import Path
 
 def run_command(cmd, description, check=True):
-    """Run shell command with logging"""
+    """Run a command (argument list, no shell) with logging"""
     print(f"🔧 {description}")
-    print(f"   Command: {cmd}")
+    print(f"   Command: {' '.join(cmd)}")
 
     try:
-        result = subprocess.run(cmd, shell=True, check=check, capture_output=True, text=True)
+        result = subprocess.run(cmd, check=check, capture_output=True, text=True)
         if result.stdout:
             print(f"   ✅ {result.stdout.strip()}")
         return True
@@ -35,7 +35,9 @@ def setup_environment():
     requirements_file = Path("requirements.txt")
     if requirements_file.exists():
         print("📦 Installing dependencies...")
-        run_command("pip install -r requirements.txt", "Installing requirements")
+        # pip has no supported in-process API; run it under this same interpreter
+        run_command([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"],
+                    "Installing requirements")
     else:
         print("⚠️ requirements.txt not found")
 
@@ -46,14 +48,21 @@ def initialize_database():
     # Change to project directory
     os.chdir(Path(__file__).parent)
 
-    # Run database initialization
-    run_command("python database/init_db.py", "Creating database schema")
+    # Run database initialization in-process rather than in a second interpreter
+    print("🔧 Creating database schema")
+    try:
+        from database.init_db import init_database
+        init_database("database/critics.db")
+        return True
+    except Exception as e:
+        print(f"   ❌ Error: {e}")
+        return False
 
 def test_database():
     """Test database functionality"""
     print("\n🧪 Testing database...")
 
-    import sqlite3
+    from db_utils import open_db
 
     db_path = "database/critics.db"
     if not Path(db_path).exists():
@@ -61,20 +70,18 @@ def test_database():
         return False
 
     try:
-        with sqlite3.connect(db_path) as conn:
+        with open_db(db_path) as conn:
             cursor = conn.cursor()
 
-            # Test basic queries
-            cursor.execute("SELECT COUNT(*) FROM characters WHERE active = TRUE")
-            active_chars = cursor.fetchone()[0]
+            # Test basic queries, all three counts in one statement
+            cursor.execute("""
+                SELECT (SELECT COUNT(*) FROM characters WHERE active = TRUE),
+                       (SELECT COUNT(*) FROM media),
+                       (SELECT COUNT(*) FROM critics)
+            """)
+            active_chars, total_media, total_critics = cursor.fetchone()
             print(f"   ✅ Active characters: {active_chars}")
-
-            cursor.execute("SELECT COUNT(*) FROM media")
-            total_media = cursor.fetchone()[0]
             print(f"   ✅ Total media: {total_media}")
-
-            cursor.execute("SELECT COUNT(*) FROM critics")
-            total_critics = cursor.fetchone()[0]
             print(f"   ✅ Total critics: {total_critics}")
 
             return True
@@ -87,7 +94,7 @@ def insert_test_data():
     """Insert some test data"""
     print("\n🎬 Inserting test data...")
 
-    import sqlite3
+    from db_utils import open_db
 
     test_data = {
         "tmdb_id": "338969",
@@ -99,14 +106,23 @@ def insert_test_data():
     }
 
     try:
-        with sqlite3.connect("database/critics.db") as conn:
+        with open_db("database/critics.db") as conn:
             cursor = conn.cursor()
 
-            # Insert test media
-            cursor.execute("""
-                INSERT OR REPLACE INTO media
+            # Insert test media. UPSERT keeps the row (and its id) in place, where
+            # INSERT OR REPLACE would delete it and cascade-delete its critics.
+            # Unchanged rows aren't rewritten, and then RETURNING yields nothing.
+            row = cursor.execute("""
+                INSERT INTO media
                 (tmdb_id, jellyfin_id, title, year, type, overview)
                 VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(tmdb_id) DO UPDATE SET
+                    jellyfin_id = excluded.jellyfin_id, title = excluded.title,
+                    year = excluded.year, type = excluded.type, overview = excluded.overview
+                WHERE jellyfin_id IS NOT excluded.jellyfin_id OR title IS NOT excluded.title
+                   OR year IS NOT excluded.year OR type IS NOT excluded.type
+                   OR overview IS NOT excluded.overview
+                RETURNING id
             """, (
                 test_data["tmdb_id"],
                 test_data["jellyfin_id"],
@@ -114,9 +130,9 @@ def insert_test_data():
                 test_data["year"],
                 test_data["type"],
                 test_data["overview"]
-            ))
+            )).fetchone()
 
-            media_id = cursor.lastrowid or cursor.execute(
+            media_id = row[0] if row else cursor.execute(
                 "SELECT id FROM media WHERE tmdb_id = ?", (test_data["tmdb_id"],)
             ).fetchone()[0]
 
@@ -134,12 +150,15 @@ def insert_test_data():
                 }
             ]
 
-            for critic in test_critics:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO critics
-                    (media_id, character_id, rating, content)
-                    VALUES (?, ?, ?, ?)
-                """, (media_id, critic["character_id"], critic["rating"], critic["content"]))
+            cursor.executemany("""
+                INSERT INTO critics
+                (media_id, character_id, rating, content)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(media_id, character_id) DO UPDATE SET
+                    rating = excluded.rating, content = excluded.content
+                WHERE rating IS NOT excluded.rating OR content IS NOT excluded.content
+            """, [(media_id, critic["character_id"], critic["rating"], critic["content"])
+                  for critic in test_critics])
 
             conn.commit()
             print(f"   ✅ Test data inserted for '{test_data['title']}'")
@@ -157,8 +176,8 @@ def start_api_server():
     print("   Press Ctrl+C to stop the server")
 
     try:
-        os.chdir("api")
-        os.system("python main.py")
+        # uvicorn's reloader needs its own process; skip the shell and reuse this interpreter
+        subprocess.run([sys.executable, "main.py"], cwd="api")
     except KeyboardInterrupt:
         print("\n🛑 Server stopped by user")
     except Exception as e:
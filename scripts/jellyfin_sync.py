@@ -8,7 +8,9 @@ import sqlite3
 import json
 import asyncio
 import httpx
-from typing import List, Dict, Optional, Any
+from collections import deque
+from itertools import islice
+from typing import List, Dict, NamedTuple, Optional, Any, AsyncIterator
 from datetime import datetime
 from pathlib import Path
 import argparse
@@ -17,33 +19,147 @@ import argparse
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
-from models.schemas import MediaDB, MediaType
+from db_utils import indexes_deferred, open_db
+from models.schemas import MediaType
+
+# orjson parses the raw response bytes with no str decode step and is several
+# times faster on large item pages; fall back to the stdlib when it's missing.
+# Both paths write the same compact UTF-8 JSON.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(value) -> str:
+        return orjson.dumps(value).decode()
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(value) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+# Jellyfin item Type -> media.type; any other type is skipped
+_MEDIA_TYPES = {'Movie': MediaType.MOVIE.value, 'Series': MediaType.SERIES.value}
+
+# Jellyfin RunTimeTicks are 100 ns units
+_TICKS_PER_MINUTE = 600_000_000
+
+# Parse errors listed by name per page; the rest are only counted
+_MAX_REPORTED_ERRORS = 20
+
+# Library pages fetched at once; bounded so a large library doesn't flood the server
+_PAGE_CONCURRENCY = 8
+
+# Rows per save transaction (5000 rows of media data stay well inside the page cache)
+_SAVE_CHUNK_ROWS = 5000
+
+_MEDIA_COUNT_SQL = "SELECT COUNT(*) FROM media"
+
+class _MediaRow(NamedTuple):
+    """One media row as parse_media_items_to_rows builds it, in _MEDIA_UPSERT_SQL
+    parameter order; executemany binds it as-is, like a plain tuple"""
+    tmdb_id: str
+    jellyfin_id: str
+    title: str
+    original_title: Optional[str]
+    year: Optional[int]
+    type: str
+    genres: Optional[str]
+    overview: Optional[str]
+    poster_url: Optional[str]
+    backdrop_url: Optional[str]
+    imdb_id: Optional[str]
+    runtime: Optional[int]
+    vote_average: Optional[float]
+    vote_count: Optional[int]
+
+# Only rows whose synced data differs are rewritten. A no-op UPDATE would still
+# dirty pages and the WAL and fire the updated_at and FTS triggers.
+_MEDIA_UPSERT_WHERE = """
+        WHERE tmdb_id IS NOT excluded.tmdb_id OR jellyfin_id IS NOT excluded.jellyfin_id
+           OR title IS NOT excluded.title OR original_title IS NOT excluded.original_title
+           OR year IS NOT excluded.year OR type IS NOT excluded.type
+           OR genres IS NOT excluded.genres OR overview IS NOT excluded.overview
+           OR poster_url IS NOT excluded.poster_url OR backdrop_url IS NOT excluded.backdrop_url
+           OR imdb_id IS NOT excluded.imdb_id OR runtime IS NOT excluded.runtime
+           OR vote_average IS NOT excluded.vote_average OR vote_count IS NOT excluded.vote_count"""
+
+_MEDIA_UPSERT_SET = """
+        tmdb_id = excluded.tmdb_id, jellyfin_id = excluded.jellyfin_id, title = excluded.title,
+        original_title = excluded.original_title, year = excluded.year,
+        type = excluded.type, genres = excluded.genres, overview = excluded.overview,
+        poster_url = excluded.poster_url, backdrop_url = excluded.backdrop_url,
+        imdb_id = excluded.imdb_id, runtime = excluded.runtime,
+        vote_average = excluded.vote_average, vote_count = excluded.vote_count,
+        updated_at = CURRENT_TIMESTAMP"""
+
+# Insert-or-update in a single statement, so _save_chunk needs no per-row
+# existence check and can hand the whole chunk to executemany. Matched on
+# tmdb_id first; an item whose TMDB id changed in Jellyfin is matched on its
+# jellyfin_id and re-pointed, instead of failing that UNIQUE constraint.
+_MEDIA_UPSERT_SQL = f"""
+    INSERT INTO media (
+        tmdb_id, jellyfin_id, title, original_title, year, type,
+        genres, overview, poster_url, backdrop_url, imdb_id,
+        runtime, vote_average, vote_count
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(tmdb_id) DO UPDATE SET{_MEDIA_UPSERT_SET}{_MEDIA_UPSERT_WHERE}
+    ON CONFLICT(jellyfin_id) DO UPDATE SET{_MEDIA_UPSERT_SET}{_MEDIA_UPSERT_WHERE}
+"""
+
+_SYNC_LOG_INSERT_SQL = """
+    INSERT INTO sync_log (
+        sync_type, total_processed, total_success, total_errors,
+        completed_at, status, error_message, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
 class JellyfinSync:
     def __init__(self, jellyfin_url: str, api_key: str, db_path: str):
         self.jellyfin_url = jellyfin_url.rstrip('/')
         self.api_key = api_key
         self.db_path = db_path
+        self._items_url = f"{self.jellyfin_url}/Items/"
         self.session = None
+        self.conn = None
 
     async def __aenter__(self):
-        self.session = httpx.AsyncClient(timeout=30.0)
+        # Base URL and auth header set once on the client instead of on every request.
+        # The pool keeps one warm connection per concurrent page fetch, and the
+        # transport retries failed connects (not requests) twice.
+        self.session = httpx.AsyncClient(
+            base_url=self.jellyfin_url,
+            headers={"X-Emby-Token": self.api_key},
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=httpx.AsyncHTTPTransport(
+                limits=httpx.Limits(
+                    max_connections=_PAGE_CONCURRENCY * 2,
+                    max_keepalive_connections=_PAGE_CONCURRENCY,
+                    keepalive_expiry=60
+                ),
+                retries=2
+            )
+        )
+        # One connection for every save and the sync log, opened (and tuned) once.
+        # Saves run in worker threads (one at a time), hence check_same_thread=False.
+        # open_db applies WAL + synchronous=NORMAL, so each save chunk costs one
+        # sync at commit; `with self.conn` commits or rolls back without closing it.
+        self.conn = open_db(self.db_path, check_same_thread=False)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if self.session:
             await self.session.aclose()
+        if self.conn:
+            self.conn.close()
 
     async def test_connection(self) -> bool:
         """Test connection to Jellyfin server"""
         try:
-            response = await self.session.get(
-                f"{self.jellyfin_url}/System/Info",
-                headers={"X-Emby-Token": self.api_key}
-            )
+            response = await self.session.get("/System/Info")
             response.raise_for_status()
 
-            server_info = response.json()
+            server_info = _json_loads(response.content)
             print(f"✅ Connected to Jellyfin: {server_info.get('ServerName', 'Unknown')}")
             print(f"   Version: {server_info.get('Version', 'Unknown')}")
             return True
@@ -55,12 +171,9 @@ class JellyfinSync:
     async def get_users(self) -> List[Dict[str, Any]]:
         """Get all users from Jellyfin"""
         try:
-            response = await self.session.get(
-                f"{self.jellyfin_url}/Users",
-                headers={"X-Emby-Token": self.api_key}
-            )
+            response = await self.session.get("/Users")
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
 
         except Exception as e:
             print(f"❌ Failed to get users: {e}")
@@ -69,12 +182,9 @@ class JellyfinSync:
     async def get_libraries(self, user_id: str) -> List[Dict[str, Any]]:
         """Get all media libraries for a user"""
         try:
-            response = await self.session.get(
-                f"{self.jellyfin_url}/Users/{user_id}/Views",
-                headers={"X-Emby-Token": self.api_key}
-            )
+            response = await self.session.get(f"/Users/{user_id}/Views")
             response.raise_for_status()
-            return response.json().get('Items', [])
+            return _json_loads(response.content).get('Items', [])
 
         except Exception as e:
             print(f"❌ Failed to get libraries: {e}")
@@ -90,6 +200,13 @@ class JellyfinSync:
                 'ParentId': library_id,
                 'Recursive': 'true',
                 'Fields': 'ProviderIds,Overview,Genres,ProductionYear,RunTimeTicks,CommunityRating,VoteCount,PremiereDate',
+                # Only what parse_media_items_to_rows reads: no per-user data, and image
+                # tags just for the two image types, one each (presence is all we check)
+                'EnableUserData': 'false',
+                'EnableImageTypes': 'Primary,Backdrop',
+                'ImageTypeLimit': 1,
+                # Items without a TMDB ID would only be dropped by parse_media_items_to_rows
+                'HasTmdbId': 'true',
                 'Limit': limit,
                 'StartIndex': start_index
             }
@@ -98,148 +215,179 @@ class JellyfinSync:
                 params['IncludeItemTypes'] = ','.join(item_types)
 
             response = await self.session.get(
-                f"{self.jellyfin_url}/Users/{user_id}/Items",
-                headers={"X-Emby-Token": self.api_key},
+                f"/Users/{user_id}/Items",
                 params=params
             )
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
 
         except Exception as e:
             print(f"❌ Failed to get library items: {e}")
             return {'Items': [], 'TotalRecordCount': 0}
 
-    def parse_media_item(self, item: Dict[str, Any]) -> Optional[MediaDB]:
-        """Parse Jellyfin item to MediaDB model"""
-        try:
-            # Map Jellyfin types to our types
-            jellyfin_type = item.get('Type', '')
-            if jellyfin_type == 'Movie':
-                media_type = MediaType.MOVIE
-            elif jellyfin_type == 'Series':
-                media_type = MediaType.SERIES
-            else:
-                return None  # Skip unsupported types
-
-            # Get provider IDs
-            provider_ids = item.get('ProviderIds', {})
-            tmdb_id = provider_ids.get('Tmdb')
-
-            if not tmdb_id:
-                print(f"⚠️ Skipping {item.get('Name', 'Unknown')} - No TMDB ID")
-                return None
-
-            # Parse genres
-            genres_list = item.get('Genres', [])
-            genres_json = json.dumps(genres_list) if genres_list else None
-
-            # Runtime in minutes
-            runtime_ticks = item.get('RunTimeTicks')
-            runtime_minutes = None
-            if runtime_ticks:
-                runtime_minutes = int(runtime_ticks / 600000000)  # Convert from ticks to minutes
-
-            # Parse year
-            year = item.get('ProductionYear') or item.get('PremiereDate', '')
-            if isinstance(year, str) and year:
-                try:
-                    year = int(year[:4])
-                except (ValueError, IndexError):
-                    year = None
-
-            return MediaDB(
-                tmdb_id=str(tmdb_id),
-                jellyfin_id=item['Id'],
-                title=item.get('Name', ''),
-                original_title=item.get('OriginalTitle'),
-                year=year,
-                type=media_type,
-                genres=genres_json,
-                overview=item.get('Overview'),
-                poster_url=f"{self.jellyfin_url}/Items/{item['Id']}/Images/Primary" if item.get('ImageTags', {}).get('Primary') else None,
-                backdrop_url=f"{self.jellyfin_url}/Items/{item['Id']}/Images/Backdrop" if item.get('BackdropImageTags') else None,
-                imdb_id=provider_ids.get('Imdb'),
-                runtime=runtime_minutes,
-                vote_average=item.get('CommunityRating'),
-                vote_count=item.get('VoteCount')
+    async def iter_library_pages(self, user_id: str, library_id: str,
+                                 item_types: List[str] = None,
+                                 limit: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """Yield a library's item pages in offset order as they arrive
+
+        The first page carries TotalRecordCount. The pages after it are fetched
+        in a sliding window of _PAGE_CONCURRENCY requests, so the caller parses
+        and saves a page while the next ones download.
+        """
+        page = await self.get_library_items(user_id, library_id, item_types, limit, 0)
+        offsets = iter(range(limit, page.get('TotalRecordCount', 0), limit))
+
+        def fetch(start_index):
+            return asyncio.create_task(
+                self.get_library_items(user_id, library_id, item_types, limit, start_index)
             )
 
-        except Exception as e:
-            print(f"❌ Error parsing item {item.get('Name', 'Unknown')}: {e}")
-            return None
-
-    def save_media_to_db(self, media_items: List[MediaDB]) -> Dict[str, int]:
-        """Save media items to database"""
-        stats = {'inserted': 0, 'updated': 0, 'skipped': 0}
-
-        with sqlite3.connect(self.db_path) as conn:
+        window = deque(fetch(start_index) for start_index in islice(offsets, _PAGE_CONCURRENCY))
+        # Pages are handed over through a one-slot list and popped on yield, so
+        # this frame holds no reference to a page once the caller has it
+        ready = [page]
+        del page
+        try:
+            yield ready.pop()
+            while window:
+                ready.append(await window.popleft())
+                # Keep the window full while the caller works on this page
+                for start_index in islice(offsets, 1):
+                    window.append(fetch(start_index))
+                yield ready.pop()
+        finally:
+            # Consumer stopped early (or failed): drop the fetches still in flight
+            for task in window:
+                task.cancel()
+
+    def parse_media_items_to_rows(self, items: List[Dict[str, Any]]) -> List[_MediaRow]:
+        """Parse a page of Jellyfin items straight to _MEDIA_UPSERT_SQL parameter tuples
+
+        Unsupported types and items without a TMDB ID are left out. Skips and
+        parse errors are reported in one summary after the page, not per item.
+        """
+        rows = []
+        append = rows.append
+        items_url = self._items_url
+        no_tmdb = 0
+        errors = []
+
+        for item in items:
+            get = item.get
+            try:
+                # Map Jellyfin types to our types
+                media_type = _MEDIA_TYPES.get(get('Type'))
+                if media_type is None:
+                    continue  # Skip unsupported types
+
+                # Get provider IDs
+                provider_ids = get('ProviderIds', {})
+                tmdb_id = provider_ids.get('Tmdb')
+
+                if not tmdb_id:
+                    no_tmdb += 1
+                    continue
+
+                genres_list = get('Genres', [])
+                runtime_ticks = get('RunTimeTicks')
+
+                # Parse year: ProductionYear, else the leading YYYY of PremiereDate
+                year = get('ProductionYear')
+                if not year:
+                    premiere_date = get('PremiereDate')
+                    year = int(premiere_date[:4]) if premiere_date and premiere_date[:4].isdigit() else None
+
+                item_id = item['Id']
+                append(_MediaRow(
+                    str(tmdb_id), item_id, get('Name', ''), get('OriginalTitle'),
+                    year, media_type,
+                    _json_dumps(genres_list) if genres_list else None,
+                    get('Overview'),
+                    f"{items_url}{item_id}/Images/Primary" if get('ImageTags', {}).get('Primary') else None,
+                    f"{items_url}{item_id}/Images/Backdrop" if get('BackdropImageTags') else None,
+                    provider_ids.get('Imdb'),
+                    runtime_ticks // _TICKS_PER_MINUTE if runtime_ticks else None,
+                    get('CommunityRating'), get('VoteCount'),
+                ))
+
+            except Exception as e:
+                errors.append(f"{get('Name', 'Unknown')}: {e}")
+
+        if no_tmdb:
+            print(f"⚠️ Skipped {no_tmdb} item(s) with no TMDB ID")
+        if errors:
+            print(f"❌ Error parsing {len(errors)} item(s):")
+            for error in errors[:_MAX_REPORTED_ERRORS]:
+                print(f"   - {error}")
+            if len(errors) > _MAX_REPORTED_ERRORS:
+                print(f"   ... and {len(errors) - _MAX_REPORTED_ERRORS} more")
+
+        return rows
+
+    def _save_chunk(self, chunk: List[_MediaRow], stats: Dict[str, int]):
+        """Upsert one chunk of rows in its own transaction, adding to stats"""
+        with self.conn as conn:
             cursor = conn.cursor()
 
-            for media in media_items:
+            # Take the write lock before counting so no other writer lands between
+            # the two counts. Inserts are whatever grew the table; rowcount covers
+            # inserts plus the rows the upsert actually rewrote.
+            cursor.execute("BEGIN IMMEDIATE")
+            count_before = cursor.execute(_MEDIA_COUNT_SQL).fetchone()[0]
+
+            # A chunk at least as large as the table (an initial import) is cheaper
+            # to index in one rebuild afterwards than row by row; small
+            # incremental syncs keep the indexes in place
+            deferred_rows = len(chunk) if len(chunk) >= count_before else 0
+
+            try:
+                with indexes_deferred(conn, 'media', deferred_rows):
+                    cursor.executemany(_MEDIA_UPSERT_SQL, chunk)
+                written = cursor.rowcount
+                failed = 0
+            except sqlite3.Error:
+                # One bad row fails the whole chunk: redo it row by row and skip the failures.
+                # The rollback also restores any index dropped above.
+                conn.rollback()
+                cursor.execute("BEGIN IMMEDIATE")
+                written = failed = 0
+                for row in chunk:
+                    try:
+                        cursor.execute(_MEDIA_UPSERT_SQL, row)
+                        written += cursor.rowcount
+                    except sqlite3.Error as e:
+                        print(f"❌ Error saving {row.title}: {e}")
+                        failed += 1
+
+            inserted = cursor.execute(_MEDIA_COUNT_SQL).fetchone()[0] - count_before
+            stats['inserted'] += inserted
+            stats['updated'] += written - inserted
+            stats['unchanged'] += len(chunk) - written - failed
+            stats['skipped'] += failed
+
+    async def _save_worker(self, queue: asyncio.Queue, stats: Dict[str, int]):
+        """Save queued row chunks from a worker thread until the None sentinel"""
+        error = None
+        while (chunk := await queue.get()) is not None:
+            # After a failure keep draining, so the producer never blocks on a full queue
+            if error is None:
                 try:
-                    # Check if exists
-                    cursor.execute(
-                        "SELECT id FROM media WHERE tmdb_id = ?",
-                        (media.tmdb_id,)
-                    )
-                    existing = cursor.fetchone()
-
-                    if existing:
-                        # Update existing
-                        cursor.execute("""
-                            UPDATE media SET
-                                jellyfin_id = ?, title = ?, original_title = ?, year = ?,
-                                type = ?, genres = ?, overview = ?, poster_url = ?,
-                                backdrop_url = ?, imdb_id = ?, runtime = ?,
-                                vote_average = ?, vote_count = ?, updated_at = ?
-                            WHERE tmdb_id = ?
-                        """, (
-                            media.jellyfin_id, media.title, media.original_title, media.year,
-                            media.type.value, media.genres, media.overview, media.poster_url,
-                            media.backdrop_url, media.imdb_id, media.runtime,
-                            media.vote_average, media.vote_count, datetime.now().isoformat(),
-                            media.tmdb_id
-                        ))
-                        stats['updated'] += 1
-                    else:
-                        # Insert new
-                        cursor.execute("""
-                            INSERT INTO media (
-                                tmdb_id, jellyfin_id, title, original_title, year, type,
-                                genres, overview, poster_url, backdrop_url, imdb_id,
-                                runtime, vote_average, vote_count
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """, (
-                            media.tmdb_id, media.jellyfin_id, media.title, media.original_title,
-                            media.year, media.type.value, media.genres, media.overview,
-                            media.poster_url, media.backdrop_url, media.imdb_id, media.runtime,
-                            media.vote_average, media.vote_count
-                        ))
-                        stats['inserted'] += 1
-
+                    await asyncio.to_thread(self._save_chunk, chunk, stats)
                 except Exception as e:
-                    print(f"❌ Error saving {media.title}: {e}")
-                    stats['skipped'] += 1
-
-            conn.commit()
-
-        return stats
+                    error = e
+        if error is not None:
+            raise error
 
     def log_sync_operation(self, stats: Dict[str, int], error_message: str = None):
         """Log sync operation to database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.conn as conn:
             cursor = conn.cursor()
 
-            total_processed = stats.get('inserted', 0) + stats.get('updated', 0) + stats.get('skipped', 0)
-            total_success = stats.get('inserted', 0) + stats.get('updated', 0)
+            total_success = stats.get('inserted', 0) + stats.get('updated', 0) + stats.get('unchanged', 0)
+            total_processed = total_success + stats.get('skipped', 0)
             total_errors = stats.get('skipped', 0)
 
-            cursor.execute("""
-                INSERT INTO sync_log (
-                    sync_type, total_processed, total_success, total_errors,
-                    completed_at, status, error_message, metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(_SYNC_LOG_INSERT_SQL, (
                 'jellyfin_sync',
                 total_processed,
                 total_success,
@@ -278,57 +426,70 @@ class JellyfinSync:
         libraries = await self.get_libraries(user_id)
         print(f"📚 Found {len(libraries)} libraries")
 
-        all_media = []
-        total_stats = {'movies': 0, 'series': 0, 'processed': 0}
-
-        # Process each library
-        for library in libraries:
-            lib_name = library.get('Name', 'Unknown')
-            lib_id = library['Id']
-
-            print(f"🔍 Processing library: {lib_name}")
-
-            # Get all items in batches
-            start_index = 0
-            batch_size = 500
-
-            while True:
-                result = await self.get_library_items(
-                    user_id, lib_id, library_types, batch_size, start_index
-                )
+        total_stats = {'movies': 0, 'series': 0, 'parsed': 0, 'processed': 0}
 
-                items = result.get('Items', [])
-                if not items:
-                    break
+        # Full chunks are saved from a worker thread while later pages are
+        # fetched and parsed. Only the rows not yet handed over are kept.
+        save_stats = {'inserted': 0, 'updated': 0, 'unchanged': 0, 'skipped': 0}
+        queue = asyncio.Queue(maxsize=4)
+        saver = asyncio.create_task(self._save_worker(queue, save_stats))
+        pending = []
 
-                print(f"   📝 Processing batch {start_index // batch_size + 1}: {len(items)} items")
-
-                # Parse items
-                for item in items:
-                    media = self.parse_media_item(item)
-                    if media:
-                        all_media.append(media)
-                        if media.type == MediaType.MOVIE:
-                            total_stats['movies'] += 1
-                        else:
-                            total_stats['series'] += 1
-
-                total_stats['processed'] += len(items)
-
-                # Check if we got all items
-                if len(items) < batch_size:
-                    break
-
-                start_index += batch_size
-
-        print(f"📊 Parsed {len(all_media)} media items ({total_stats['movies']} movies, {total_stats['series']} series)")
-
-        # Save to database
-        if all_media:
-            print("💾 Saving to database...")
-            save_stats = self.save_media_to_db(all_media)
+        try:
+            # Process each library
+            for library in libraries:
+                lib_name = library.get('Name', 'Unknown')
+                lib_id = library['Id']
+
+                print(f"🔍 Processing library: {lib_name}")
+
+                # Get all items in batches, each parsed and queued for saving as it
+                # arrives while the following pages are still downloading
+                batch_size = 500
+
+                batch_number = 0
+                async for result in self.iter_library_pages(user_id, lib_id, library_types, batch_size):
+                    batch_number += 1
+                    items = result.get('Items', [])
+                    if not items:
+                        continue
+
+                    print(f"   📝 Processing batch {batch_number}: {len(items)} items")
+
+                    # Parse items, then drop the raw page: only its _MediaRows are
+                    # kept, so memory stays bounded by the fetch window and the
+                    # pending chunk rather than the library size
+                    rows = self.parse_media_items_to_rows(items)
+                    total_stats['processed'] += len(items)
+                    del result, items
+                    pending.extend(rows)
+                    total_stats['parsed'] += len(rows)
+
+                    total_stats['movies'] += sum(1 for row in rows if row.type == MediaType.MOVIE.value)
+
+                    while len(pending) >= _SAVE_CHUNK_ROWS:
+                        await queue.put(pending[:_SAVE_CHUNK_ROWS])
+                        del pending[:_SAVE_CHUNK_ROWS]
+
+            total_stats['series'] = total_stats['parsed'] - total_stats['movies']
+
+            print(f"📊 Parsed {total_stats['parsed']} media items ({total_stats['movies']} movies, {total_stats['series']} series)")
+
+            # Save to database: the remainder, then wait for the writer to finish
+            if total_stats['parsed']:
+                print("💾 Saving to database...")
+            if pending:
+                await queue.put(pending)
+            await queue.put(None)
+            await saver
+        except BaseException:
+            saver.cancel()
+            raise
+
+        if total_stats['parsed']:
             print(f"   ✅ Inserted: {save_stats['inserted']}")
             print(f"   🔄 Updated: {save_stats['updated']}")
+            print(f"   ⏭️ Unchanged: {save_stats['unchanged']}")
             print(f"   ⚠️ Skipped: {save_stats['skipped']}")
 
             # Log the operation
@@ -337,7 +498,7 @@ class JellyfinSync:
             return save_stats
         else:
             print("⚠️ No media items to save")
-            return {'inserted': 0, 'updated': 0, 'skipped': 0}
+            return {'inserted': 0, 'updated': 0, 'unchanged': 0, 'skipped': 0}
 
 async def main():
     parser = argparse.ArgumentParser(description='Sync Jellyfin media to local database')
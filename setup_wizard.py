@@ -4,19 +4,135 @@
 Interactive CLI setup for first-time installation and configuration
 """
 
+import asyncio
+import datetime
+import functools
+import importlib.util
+import json
+import os
+import re
 import sys
-import socket
+from collections import ChainMap
 from pathlib import Path
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any, List, Mapping, Optional
 
 import click
-import httpx
-import questionary
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 from rich.table import Table
 
+# httpx, questionary and rich.progress are imported where they are used, so
+# --help and the header don't pay for the network and prompt libraries
+if TYPE_CHECKING:
+    import httpx
+
+# orjson decodes the raw response bytes directly; fall back to the stdlib
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Facts about the running interpreter, fixed for the life of the process
+@functools.lru_cache(maxsize=None)
+def _python_ok() -> bool:
+    return sys.version_info >= (3, 11)
+
+
+@functools.lru_cache(maxsize=None)
+def _sqlite_ok() -> bool:
+    # The sqlite3 package ships with every Python; the C extension is what's
+    # missing on builds without SQLite
+    return importlib.util.find_spec("_sqlite3") is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _venv_active() -> bool:
+    return hasattr(sys, 'real_prefix') or sys.base_prefix != sys.prefix
+
+
+# Dependency check key -> (component, note) for the summary table
+_STATUS_MAP = {
+    "python": ("Python 3.11+", "Required for modern FastAPI"),
+    "sqlite": ("SQLite Database", "For storing critics and media data"),
+    "port_8000": ("Port 8000", "Default API port (configurable)"),
+    "virtual_env": ("Virtual Environment", "Recommended for isolation"),
+    "required_packages": ("Python Packages", "FastAPI, httpx, uvicorn")
+}
+
+# Checks that stop the wizard when they fail
+_CRITICAL_CHECKS = ("python", "sqlite", "required_packages")
+
+_REQUIRED_PACKAGES = ("fastapi", "httpx", "uvicorn")
+
+# Settings the wizard always writes, over the .env.example values
+_ENV_DEFAULTS = {
+    "PARODY_CRITICS_ENV": "production",
+    "PARODY_CRITICS_DB_PATH": "database/critics.db",
+    "PARODY_CRITICS_HOST": "0.0.0.0",
+    "PARODY_CRITICS_PORT": "8000",
+    "RELOAD": "false",
+    "SYNC_BATCH_SIZE": "100",
+    "SYNC_MAX_CONCURRENT": "5",
+    "PARODY_CRITICS_CACHE_DURATION": "300",
+    "PARODY_CRITICS_LOG_LEVEL": "INFO",
+}
+
+# Keys the Jellyfin and LLM steps answer for. The .env.example sample values
+# for these are never copied: a key the wizard left unset falls back to the
+# config.py default rather than to the template's example.
+_WIZARD_ENV_KEYS = frozenset({
+    "JELLYFIN_URL", "JELLYFIN_API_TOKEN", "JELLYFIN_DB_PATH",
+    "LLM_PROVIDER", "LLM_OLLAMA_URL", "LLM_PRIMARY_MODEL", "LLM_SECONDARY_MODEL",
+    "LLM_TIMEOUT", "LLM_MAX_RETRIES", "LLM_ENABLE_FALLBACK",
+})
+
+# Keys for which an empty answer is meaningful and is written as KEY=:
+# no fallback model, no token, no Jellyfin database
+_EMPTY_OK_ENV_KEYS = frozenset({
+    "LLM_SECONDARY_MODEL", "JELLYFIN_API_TOKEN", "JELLYFIN_DB_PATH",
+})
+
+# LLM system choice -> LLM_PROVIDER
+_LLM_PROVIDERS = {
+    "Ollama (Local - Recommended)": "ollama",
+    "OpenAI API (Cloud - Paid)": "openai",
+    "Anthropic Claude API (Cloud - Paid)": "anthropic",
+    "Multiple (Hybrid Setup)": "ollama",
+}
+
+
+# One KEY=value setting; comments, blank lines and malformed keys don't match
+_ENV_LINE = re.compile(r'^\s*([A-Z_][A-Z0-9_]*)\s*=\s*(.*?)\s*$')
+
+
+def _parse_dotenv(text: str) -> Dict[str, str]:
+    """KEY=value settings of a dotenv file, in file order.
+
+    Comments, blank or malformed lines and .env.example placeholders ("your-...",
+    "/path/to/...") are skipped, so unset keys fall back to config.py defaults.
+    """
+    return dict(
+        match.groups()
+        for line in text.splitlines()
+        if (match := _ENV_LINE.match(line))
+        and 'your-' not in match[2] and not match[2].startswith('/path/to/')
+    )
+
+
+# Jellyfin URLs tried before continuing without a validated connection
+_JELLYFIN_URL_ATTEMPTS = 3
+
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+def _human_bytes(n: int) -> str:
+    """Format a byte count with a binary unit picked from its bit length"""
+    i = min(max(0, (n.bit_length() - 1) // 10), len(_BYTE_UNITS) - 1)
+    return f"{n / (1 << (i * 10)):.1f}{_BYTE_UNITS[i]}"
+
+
 # Initialize Rich Console
 console = Console()
 
@@ -26,6 +142,16 @@ class SetupWizard:
         self.project_root = Path(__file__).parent
         self.env_file = self.project_root / '.env'
         self.env_example_file = self.project_root / '.env.example'
+        # .env.example settings, read and parsed once
+        self._env_template = _parse_dotenv(
+            self.env_example_file.read_bytes().decode('utf-8') if self.env_example_file.exists() else ""
+        )
+        # Shared by every HTTP probe, so retries reuse a keep-alive connection;
+        # opened and closed by run_setup()
+        self.client: Optional["httpx.AsyncClient"] = None
+        # Ollama /api/tags model lists by server URL, so running the LLM step
+        # again doesn't refetch them
+        self._ollama_models_cache: Dict[str, List[Dict[str, Any]]] = {}
 
     def print_header(self):
         """Display fancy wizard header"""
@@ -40,94 +166,84 @@ Let's create some hilarious movie reviews together! 🎬✨
         """
         console.print(Panel(header_text, style="bold blue", expand=False))
 
-    def check_dependencies(self) -> Dict[str, bool]:
+    async def _check_python(self):
+        python_version = sys.version_info
+        if _python_ok():
+            return "python", True, f"✅ Python {python_version.major}.{python_version.minor} detected"
+        return "python", False, f"❌ Python {python_version.major}.{python_version.minor} - Need 3.11+"
+
+    async def _check_sqlite(self):
+        if _sqlite_ok():
+            return "sqlite", True, "✅ SQLite available"
+        return "sqlite", False, "❌ SQLite not available"
+
+    async def _check_port(self):
+        # Either way the port is OK: a port in use just needs configuring.
+        # The 127.0.0.1 literal skips the getaddrinfo lookup, and a connect that
+        # gets no answer within 100 ms (filtered port) counts as free.
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection('127.0.0.1', 8000), 0.1)
+        except (OSError, asyncio.TimeoutError):
+            return "port_8000", True, "✅ Port 8000 available"
+        writer.close()
+        try:
+            await asyncio.wait_for(writer.wait_closed(), 0.1)
+        except (OSError, asyncio.TimeoutError):
+            pass
+        return "port_8000", True, "⚠️ Port 8000 in use (can be configured)"
+
+    async def _check_venv(self):
+        if _venv_active():
+            return "virtual_env", True, "✅ Virtual environment active"
+        return "virtual_env", False, "⚠️ No virtual environment detected"
+
+    async def _check_packages(self):
+        # find_spec only locates each package; __import__ would run all of
+        # fastapi's (and pydantic's, starlette's...) import-time code. Each lookup
+        # walks sys.path on disk, so they run on worker threads, alongside each
+        # other and the port probe, instead of blocking the event loop.
+        specs = await asyncio.gather(
+            *(asyncio.to_thread(importlib.util.find_spec, p) for p in _REQUIRED_PACKAGES)
+        )
+        missing_packages = [p for p, spec in zip(_REQUIRED_PACKAGES, specs) if spec is None]
+        if not missing_packages:
+            return "required_packages", True, "✅ All required packages installed"
+        return "required_packages", False, f"❌ Missing packages: {', '.join(missing_packages)}"
+
+    async def check_dependencies(self) -> Dict[str, bool]:
         """Check system dependencies and requirements"""
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
         console.print("\n[bold yellow]🔍 Step 1: Checking System Dependencies[/bold yellow]")
 
-        checks = {
-            "python": False,
-            "sqlite": False,
-            "port_8000": False,
-            "virtual_env": False,
-            "required_packages": False
-        }
+        probes = (
+            ("Checking Python version...", self._check_python),
+            ("Checking SQLite...", self._check_sqlite),
+            ("Checking port 8000 availability...", self._check_port),
+            ("Checking virtual environment...", self._check_venv),
+            ("Checking required packages...", self._check_packages),
+        )
 
+        # Every task is added up front and updated in place as its probe finishes,
+        # with redraws capped by refresh_per_second rather than forced per check
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            transient=True
+            transient=True,
+            refresh_per_second=8
         ) as progress:
+            tasks = [progress.add_task(label, total=1) for label, _ in probes]
 
-            # Python version check
-            task = progress.add_task("Checking Python version...", total=None)
-            try:
-                python_version = sys.version_info
-                if python_version >= (3, 11):
-                    checks["python"] = True
-                    progress.update(task, description=f"✅ Python {python_version.major}.{python_version.minor} detected")
-                else:
-                    progress.update(task, description=f"❌ Python {python_version.major}.{python_version.minor} - Need 3.11+")
-            except Exception:
-                progress.update(task, description="❌ Python version check failed")
-
-            progress.remove_task(task)
-
-            # SQLite check
-            task = progress.add_task("Checking SQLite...", total=None)
-            try:
-                import sqlite3  # noqa: F401
-                checks["sqlite"] = True
-                progress.update(task, description="✅ SQLite available")
-            except ImportError:
-                progress.update(task, description="❌ SQLite not available")
+            async def run_probe(task, probe):
+                key, ok, description = await probe()
+                progress.update(task, description=description, completed=1)
+                return key, ok
 
-            progress.remove_task(task)
-
-            # Port availability check
-            task = progress.add_task("Checking port 8000 availability...", total=None)
-            try:
-                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                    result = s.connect_ex(('localhost', 8000))
-                    if result != 0:  # Port is free
-                        checks["port_8000"] = True
-                        progress.update(task, description="✅ Port 8000 available")
-                    else:
-                        progress.update(task, description="⚠️ Port 8000 in use (can be configured)")
-                        checks["port_8000"] = True  # Still OK, just needs config
-            except Exception:
-                progress.update(task, description="✅ Port 8000 available (check failed, assuming OK)")
-                checks["port_8000"] = True
-
-            progress.remove_task(task)
-
-            # Virtual environment check
-            task = progress.add_task("Checking virtual environment...", total=None)
-            if hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
-                checks["virtual_env"] = True
-                progress.update(task, description="✅ Virtual environment active")
-            else:
-                progress.update(task, description="⚠️ No virtual environment detected")
-
-            progress.remove_task(task)
-
-            # Required packages check
-            task = progress.add_task("Checking required packages...", total=None)
-            required_packages = ["fastapi", "httpx", "uvicorn"]
-            missing_packages = []
-
-            for package in required_packages:
-                try:
-                    __import__(package)
-                except ImportError:
-                    missing_packages.append(package)
-
-            if not missing_packages:
-                checks["required_packages"] = True
-                progress.update(task, description="✅ All required packages installed")
-            else:
-                progress.update(task, description=f"❌ Missing packages: {', '.join(missing_packages)}")
-
-            progress.remove_task(task)
+            # Independent checks, run concurrently: the total wait is the slowest
+            # one (the port probe), not the sum
+            checks = dict(await asyncio.gather(
+                *(run_probe(task, probe) for task, (_, probe) in zip(tasks, probes))
+            ))
 
         # Display summary
         self.display_dependency_summary(checks)
@@ -140,15 +256,7 @@ Let's create some hilarious movie reviews together! 🎬✨
         table.add_column("Status")
         table.add_column("Notes", style="italic")
 
-        status_map = {
-            "python": ("Python 3.11+", "Required for modern FastAPI"),
-            "sqlite": ("SQLite Database", "For storing critics and media data"),
-            "port_8000": ("Port 8000", "Default API port (configurable)"),
-            "virtual_env": ("Virtual Environment", "Recommended for isolation"),
-            "required_packages": ("Python Packages", "FastAPI, httpx, uvicorn")
-        }
-
-        for key, (component, note) in status_map.items():
+        for key, (component, note) in _STATUS_MAP.items():
             status = "✅ OK" if checks[key] else "❌ ISSUE"
             style = "green" if checks[key] else "red"
             table.add_row(component, f"[{style}]{status}[/{style}]", note)
@@ -156,8 +264,7 @@ Let's create some hilarious movie reviews together! 🎬✨
         console.print(table)
 
         # Check if we can continue
-        critical_checks = ["python", "sqlite", "required_packages"]
-        critical_failures = [k for k in critical_checks if not checks[k]]
+        critical_failures = [k for k in _CRITICAL_CHECKS if not checks[k]]
 
         if critical_failures:
             console.print(f"\n[red]❌ Critical dependencies missing: {', '.join(critical_failures)}[/red]")
@@ -167,67 +274,81 @@ Let's create some hilarious movie reviews together! 🎬✨
         console.print("\n[green]✅ All critical dependencies satisfied! Let's continue...[/green]")
         return True
 
-    async def configure_jellyfin(self) -> Dict[str, Any]:
-        """Interactive Jellyfin configuration"""
-        console.print("\n[bold yellow]📡 Step 2: Jellyfin Configuration[/bold yellow]")
+    async def _test_jellyfin_connection(self, jellyfin_url: str, api_token: Optional[str]):
+        """Probe the Jellyfin server (and token); raises when the server can't be reached"""
+        # With a token, the authenticated /Users request checks the server and
+        # the token in one round trip; /System/Info/Public is only needed without
+        # one, or to tell a rejected token from a bad URL.
+        token_rejected = None
+        if api_token:
+            headers = {"X-MediaBrowser-Token": api_token}
+            response = await self.client.get(f"{jellyfin_url}/Users", headers=headers)
+            if response.status_code in (401, 403):
+                token_rejected = response.status_code
+            if not token_rejected:
+                response.raise_for_status()
 
-        # Get Jellyfin URL
-        jellyfin_url = questionary.text(
-            "Jellyfin Server URL:",
-            default="http://localhost:8096",
-            instruction="(Include http:// or https://)"
-        ).ask()
+                users = response.json()
+                console.print(f"[green]✅ Connected to Jellyfin, API token valid! Found {len(users)} users.[/green]")
+                return
 
-        if not jellyfin_url:
-            console.print("[red]❌ Jellyfin URL is required![/red]")
-            return {}
+        response = await self.client.get(f"{jellyfin_url}/System/Info/Public")
+        response.raise_for_status()
 
-        # Test connection
-        console.print(f"\n[dim]Testing connection to {jellyfin_url}...[/dim]")
+        server_info = response.json()
+        server_name = server_info.get('ServerName', 'Unknown')
+        version = server_info.get('Version', 'Unknown')
 
-        try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{jellyfin_url}/System/Info/Public")
-                response.raise_for_status()
+        console.print(f"[green]✅ Connected to Jellyfin server: {server_name} (v{version})[/green]")
 
-                server_info = response.json()
-                server_name = server_info.get('ServerName', 'Unknown')
-                version = server_info.get('Version', 'Unknown')
+        if token_rejected:
+            console.print(f"[red]❌ API token test failed: server answered {token_rejected}[/red]")
+            console.print("[yellow]⚠️ You can update this later in the .env file[/yellow]")
 
-                console.print(f"[green]✅ Connected to Jellyfin server: {server_name} (v{version})[/green]")
+    async def configure_jellyfin(self) -> Dict[str, Any]:
+        """Interactive Jellyfin configuration"""
+        import questionary
 
-        except Exception as e:
-            console.print(f"[red]❌ Connection failed: {str(e)}[/red]")
+        console.print("\n[bold yellow]📡 Step 2: Jellyfin Configuration[/bold yellow]")
 
-            retry = questionary.confirm("Would you like to try a different URL?").ask()
-            if retry:
-                return await self.configure_jellyfin()
-            else:
-                console.print("[yellow]⚠️ Continuing without Jellyfin validation...[/yellow]")
+        api_token = None
+        for attempt in range(_JELLYFIN_URL_ATTEMPTS):
+            # Get Jellyfin URL
+            jellyfin_url = questionary.text(
+                "Jellyfin Server URL:",
+                default="http://localhost:8096",
+                instruction="(Include http:// or https://)"
+            ).ask()
 
-        # Get API Token
-        console.print("\n[dim]You need a Jellyfin API token for full functionality.[/dim]")
-        console.print("[dim]Get it from: Jellyfin Admin → Dashboard → API Keys[/dim]")
+            if not jellyfin_url:
+                console.print("[red]❌ Jellyfin URL is required![/red]")
+                return {}
 
-        api_token = questionary.password(
-            "Jellyfin API Token:",
-            instruction="(Leave empty to configure later)"
-        ).ask()
+            # Get API Token, once: a retry only asks for a different URL
+            if attempt == 0:
+                console.print("\n[dim]You need a Jellyfin API token for full functionality.[/dim]")
+                console.print("[dim]Get it from: Jellyfin Admin → Dashboard → API Keys[/dim]")
 
-        if api_token:
-            # Test API token
-            try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    headers = {"X-MediaBrowser-Token": api_token}
-                    response = await client.get(f"{jellyfin_url}/Users", headers=headers)
-                    response.raise_for_status()
+                api_token = questionary.password(
+                    "Jellyfin API Token:",
+                    instruction="(Leave empty to configure later)"
+                ).ask()
 
-                    users = response.json()
-                    console.print(f"[green]✅ API token valid! Found {len(users)} users.[/green]")
+            # Test connection
+            console.print(f"\n[dim]Testing connection to {jellyfin_url}...[/dim]")
 
+            try:
+                await self._test_jellyfin_connection(jellyfin_url, api_token)
+                break
             except Exception as e:
-                console.print(f"[red]❌ API token test failed: {str(e)}[/red]")
-                console.print("[yellow]⚠️ You can update this later in the .env file[/yellow]")
+                console.print(f"[red]❌ Connection failed: {str(e)}[/red]")
+
+                if attempt + 1 < _JELLYFIN_URL_ATTEMPTS and \
+                        questionary.confirm("Would you like to try a different URL?").ask():
+                    continue
+
+                console.print("[yellow]⚠️ Continuing without Jellyfin validation...[/yellow]")
+                break
 
         # Jellyfin database path (optional)
         console.print("\n[dim]Jellyfin database path is optional but enables advanced sync features.[/dim]")
@@ -243,22 +364,42 @@ Let's create some hilarious movie reviews together! 🎬✨
             "JELLYFIN_DB_PATH": jellyfin_db_path or ""
         }
 
+    async def _ollama_models(self, ollama_url: str) -> List[Dict[str, Any]]:
+        """Models listed by Ollama's /api/tags, fetched once per URL"""
+        models = self._ollama_models_cache.get(ollama_url)
+        if models is None:
+            response = await self.client.get(f"{ollama_url}/api/tags")
+            response.raise_for_status()
+
+            models = _json_loads(response.content).get("models", [])
+            self._ollama_models_cache[ollama_url] = models
+        return models
+
+    def _pick_model(self, message: str, models: List[str]) -> str:
+        """Model picker; typing narrows the list, for Ollama hosts with many models"""
+        import questionary
+
+        # The search filter takes over the letter keys, j/k navigation included
+        return questionary.select(
+            message,
+            choices=models,
+            use_search_filter=True,
+            use_jk_keys=False
+        ).ask()
+
     async def configure_llm(self) -> Dict[str, Any]:
         """Interactive LLM configuration"""
+        import questionary
+
         console.print("\n[bold yellow]🤖 Step 3: LLM Configuration[/bold yellow]")
 
         # Choose LLM type
         llm_type = questionary.select(
             "Which LLM system do you want to use?",
-            choices=[
-                "Ollama (Local - Recommended)",
-                "OpenAI API (Cloud - Paid)",
-                "Anthropic Claude API (Cloud - Paid)",
-                "Multiple (Hybrid Setup)"
-            ]
+            choices=list(_LLM_PROVIDERS)
         ).ask()
 
-        config = {}
+        config = {"LLM_PROVIDER": _LLM_PROVIDERS[llm_type]}
 
         if "Ollama" in llm_type or "Multiple" in llm_type:
             # Configure Ollama
@@ -272,55 +413,50 @@ Let's create some hilarious movie reviews together! 🎬✨
             console.print(f"\n[dim]Testing Ollama connection at {ollama_url}...[/dim]")
 
             try:
-                async with httpx.AsyncClient(timeout=10.0) as client:
-                    response = await client.get(f"{ollama_url}/api/tags")
-                    response.raise_for_status()
-
-                    models_data = response.json()
-                    available_models = [model["name"] for model in models_data.get("models", [])]
-
-                    if available_models:
-                        console.print(f"[green]✅ Ollama connected! Found {len(available_models)} models.[/green]")
-
-                        # Display available models
-                        table = Table(title="Available Ollama Models", show_header=True)
-                        table.add_column("Model Name", style="cyan")
-                        table.add_column("Size", style="dim")
-
-                        for model in models_data.get("models", []):
-                            name = model["name"]
-                            size = f"{model.get('size', 0) / (1024**3):.1f}GB" if model.get('size') else "Unknown"
-                            table.add_row(name, size)
-
-                        console.print(table)
-
-                        # Select primary model
-                        primary_model = questionary.select(
-                            "Select primary model:",
-                            choices=available_models
-                        ).ask()
-
-                        # Select secondary model (optional)
-                        remaining_models = [m for m in available_models if m != primary_model]
-                        if remaining_models:
-                            secondary_model = questionary.select(
-                                "Select secondary model (for fallback):",
-                                choices=["None"] + remaining_models
-                            ).ask()
-
-                            if secondary_model == "None":
-                                secondary_model = ""
-                        else:
+                models = await self._ollama_models(ollama_url)
+
+                # One pass over the models builds both the choice list and the table
+                table = Table(title="Available Ollama Models", show_header=True)
+                table.add_column("Model Name", style="cyan")
+                table.add_column("Size", style="dim")
+
+                available_models = []
+                for model in models:
+                    name = model["name"]
+                    available_models.append(name)
+                    size = _human_bytes(model['size']) if model.get('size') else "Unknown"
+                    table.add_row(name, size)
+
+                if available_models:
+                    console.print(f"[green]✅ Ollama connected! Found {len(available_models)} models.[/green]")
+
+                    # Display available models
+                    console.print(table)
+
+                    # Select primary model
+                    primary_model = self._pick_model("Select primary model:", available_models)
+
+                    # Select secondary model (optional)
+                    remaining_models = [m for m in available_models if m != primary_model]
+                    if remaining_models:
+                        secondary_model = self._pick_model(
+                            "Select secondary model (for fallback):",
+                            ["None"] + remaining_models
+                        )
+
+                        if secondary_model == "None":
                             secondary_model = ""
-
-                        config.update({
-                            "LLM_OLLAMA_URL": ollama_url,
-                            "LLM_PRIMARY_MODEL": primary_model,
-                            "LLM_SECONDARY_MODEL": secondary_model,
-                        })
                     else:
-                        console.print("[red]❌ No models found in Ollama![/red]")
-                        console.print("[dim]Pull a model first: ollama pull qwen2:7b[/dim]")
+                        secondary_model = ""
+
+                    config.update({
+                        "LLM_OLLAMA_URL": ollama_url,
+                        "LLM_PRIMARY_MODEL": primary_model,
+                        "LLM_SECONDARY_MODEL": secondary_model,
+                    })
+                else:
+                    console.print("[red]❌ No models found in Ollama![/red]")
+                    console.print("[dim]Pull a model first: ollama pull qwen2:7b[/dim]")
 
             except Exception as e:
                 console.print(f"[red]❌ Ollama connection failed: {str(e)}[/red]")
@@ -371,57 +507,41 @@ Let's create some hilarious movie reviews together! 🎬✨
 
         return config
 
-    def create_env_file(self, config: Dict[str, Any]) -> bool:
+    def create_env_file(self, config: Mapping[str, Any]) -> bool:
         """Create .env file with collected configuration"""
         console.print("\n[bold yellow]📝 Step 4: Creating Configuration File[/bold yellow]")
 
         try:
-            import datetime
-
-            # Load .env.example as template
-            if self.env_example_file.exists():
-                with open(self.env_example_file, 'r') as f:
-                    f.read()  # kept for reference, not used directly
-
-            # Create .env content
-            env_content = [
-                "# 🎭 Parody Critics - Environment Configuration",
-                f"# Generated by Setup Wizard on {datetime.datetime.now()}",
-                "",
-                "# Environment",
-                "PARODY_CRITICS_ENV=production",
-                "",
-                "# Database",
-                "PARODY_CRITICS_DB_PATH=database/critics.db",
-                "",
-                "# Server Configuration",
-                "HOST=0.0.0.0",
-                "PORT=8000",
-                "RELOAD=false",
-                ""
-            ]
-
-            # Add collected configuration
-            if config:
-                for key, value in config.items():
-                    if value:  # Only add non-empty values
-                        env_content.append(f"{key}={value}")
-
-            # Add default sync settings
-            env_content.extend([
-                "",
-                "# Sync Configuration",
-                "SYNC_BATCH_SIZE=100",
-                "SYNC_MAX_CONCURRENT=5",
-                "",
-                "# Performance",
-                "PARODY_CRITICS_CACHE_DURATION=300",
-                "PARODY_CRITICS_LOG_LEVEL=INFO"
-            ])
-
-            # Write .env file
-            with open(self.env_file, 'w') as f:
-                f.write('\n'.join(env_content))
+            # Template keys the wizard doesn't manage, then the wizard's defaults,
+            # then the collected answers; later layers win. An empty answer is
+            # only written for _EMPTY_OK_ENV_KEYS, anything else (e.g. an empty
+            # LLM_TIMEOUT, which config.py's int() would reject) is skipped
+            settings = {
+                **{key: value for key, value in self._env_template.items()
+                   if key not in _WIZARD_ENV_KEYS and key not in _ENV_DEFAULTS},
+                **_ENV_DEFAULTS,
+                **{key: "" if value is None else value for key, value in (config or {}).items()
+                   if (value is not None and str(value).strip()) or key in _EMPTY_OK_ENV_KEYS}
+            }
+            body = "\n".join(f"{key}={value}" for key, value in settings.items())
+
+            env_content = f"""# 🎭 Parody Critics - Environment Configuration
+# Generated by Setup Wizard on {datetime.datetime.now():%Y-%m-%d %H:%M:%S}
+
+{body}
+"""
+
+            # Write .env file: one write to a temp file beside it, then an atomic
+            # rename, so an interrupted run never leaves a half-written .env.
+            # 0o600 because the file holds API tokens.
+            tmp_file = self.env_file.with_name(self.env_file.name + '.tmp')
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            try:
+                os.write(fd, env_content.encode('utf-8'))
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.env_file)
 
             console.print(f"[green]✅ Configuration saved to {self.env_file}[/green]")
             console.print("[dim]You can edit this file later to modify settings.[/dim]")
@@ -463,44 +583,61 @@ Happy movie reviewing with Marco Aurelio and Rosario Costras! ✨
 # Main async function
 async def run_setup(skip_deps: bool = False, config_only: bool = False):
     """🧙‍♂️ Interactive Setup Wizard for Parody Critics"""
+    import httpx
+    import questionary
 
     wizard = SetupWizard()
 
     try:
-        wizard.print_header()
-
-        # Step 1: Dependency Check
-        if not skip_deps and not config_only:
-            deps_ok = wizard.check_dependencies()
-            if not deps_ok:
-                console.print("[red]Setup cannot continue due to missing dependencies.[/red]")
+        # HTTP/2 needs the optional h2 package (httpx[http2]); without it the
+        # client stays on HTTP/1.1. Pool limits belong to the transport once
+        # one is passed, and retries=1 re-attempts a failed connect.
+        async with httpx.AsyncClient(
+            timeout=10.0,
+            transport=httpx.AsyncHTTPTransport(
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+                retries=1
+            )
+        ) as client:
+            wizard.client = client
+
+            wizard.print_header()
+
+            # Step 1: Dependency Check. The only path into the probes and their
+            # imports (rich.progress), so --config-only/--skip-deps never load them
+            if not skip_deps and not config_only:
+                deps_ok = await wizard.check_dependencies()
+                if not deps_ok:
+                    console.print("[red]Setup cannot continue due to missing dependencies.[/red]")
+                    return
+
+                # Wait for user to continue
+                questionary.press_any_key_to_continue("Press any key to continue...").ask()
+
+            # Step 2: Jellyfin Configuration
+            console.print("\n[dim]Configuring Jellyfin connection...[/dim]")
+            jellyfin_config = await wizard.configure_jellyfin()
+
+            if not jellyfin_config:
+                console.print("[red]❌ Jellyfin configuration failed![/red]")
                 return
 
-            # Wait for user to continue
-            questionary.press_any_key_to_continue("Press any key to continue...").ask()
+            # Step 3: LLM Configuration
+            console.print("\n[dim]Configuring LLM system...[/dim]")
+            llm_config = await wizard.configure_llm()
 
-        # Step 2: Jellyfin Configuration
-        console.print("\n[dim]Configuring Jellyfin connection...[/dim]")
-        jellyfin_config = await wizard.configure_jellyfin()
+            # Step 4: Create .env file
+            # A view over both steps' answers, LLM keys taking precedence
+            all_config = ChainMap(llm_config, jellyfin_config)
+            env_created = wizard.create_env_file(all_config)
 
-        if not jellyfin_config:
-            console.print("[red]❌ Jellyfin configuration failed![/red]")
-            return
-
-        # Step 3: LLM Configuration
-        console.print("\n[dim]Configuring LLM system...[/dim]")
-        llm_config = await wizard.configure_llm()
-
-        # Step 4: Create .env file
-        all_config = {**jellyfin_config, **llm_config}
-        env_created = wizard.create_env_file(all_config)
-
-        if not env_created:
-            console.print("[red]❌ Configuration file creation failed![/red]")
-            return
+            if not env_created:
+                console.print("[red]❌ Configuration file creation failed![/red]")
+                return
 
-        # Step 5: Complete
-        wizard.setup_complete()
+            # Step 5: Complete
+            wizard.setup_complete()
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Setup cancelled by user.[/yellow]")
@@ -511,11 +648,11 @@ async def run_setup(skip_deps: bool = False, config_only: bool = False):
 # CLI Interface
 @click.command()
 @click.option('--skip-deps', is_flag=True, help='Skip dependency checks')
-@click.option('--config-only', is_flag=True, help='Only create configuration file')
+@click.option('--config-only', is_flag=True,
+              help='Only create configuration file (fast path: no dependency checks or their imports)')
 def setup(skip_deps: bool, config_only: bool):
     """🧙‍♂️ Interactive Setup Wizard for Parody Critics"""
     asyncio.run(run_setup(skip_deps, config_only))
 
 if __name__ == "__main__":
-    import asyncio
     setup()
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Media search in critic_cli — FTS5 path and LIKE fallback
+"""
+import sqlite3
+
+import pytest
+from click.testing import CliRunner
+
+import critic_cli
+from database.init_db import init_database
+
+
+class _Config:
+    def __init__(self, db_path):
+        self.db_path = db_path
+
+    def get_absolute_db_path(self):
+        return self.db_path
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "critics.db")
+    init_database(path)
+    with sqlite3.connect(path) as conn:
+        conn.executemany(
+            "INSERT INTO media (tmdb_id, jellyfin_id, title, year, type, genres) VALUES (?, ?, ?, ?, ?, ?)",
+            [("603", "jf_603", "The Matrix", 1999, "movie", '["Action","Sci-Fi"]'),
+             ("1396", "jf_1396", "Breaking Bad", 2008, "series", '["Crime","Drama"]')]
+        )
+    return path
+
+
+def test_search_command_matches_through_fts(db_path):
+    # Words out of order: only the FTS query matches, the LIKE fallback can't
+    result = CliRunner().invoke(
+        critic_cli.search, ["matrix the"], obj={"config": _Config(db_path)}
+    )
+
+    assert result.exit_code == 0
+    assert "The Matrix" in result.output
+    assert "Search failed" not in result.output
+
+
+def test_search_in_database_matches_through_fts(db_path):
+    with sqlite3.connect(db_path) as conn:
+        media = critic_cli._search_in_database("matrix the", conn)
+
+    assert media["title"] == "The Matrix"
+
+
+def test_search_in_database_falls_back_without_fts(db_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP TABLE media_fts")
+        media = critic_cli._search_in_database("Matrix", conn)
+
+    assert media["title"] == "The Matrix"
+
+
+@pytest.mark.parametrize("term", ["", "   "])
+def test_blank_term_skips_fts_instead_of_building_empty_match(db_path, term):
+    assert critic_cli._build_fts_query(term) is None
+
+    result = CliRunner().invoke(
+        critic_cli.search, [term], obj={"config": _Config(db_path)}
+    )
+    assert result.exit_code == 0
+    assert "Search failed" not in result.output
+
+
+def test_empty_term_lists_media(db_path):
+    result = CliRunner().invoke(
+        critic_cli.search, [""], obj={"config": _Config(db_path)}
+    )
+    assert "The Matrix" in result.output and "Breaking Bad" in result.output
+
+    with sqlite3.connect(db_path) as conn:
+        assert critic_cli._search_in_database("", conn) is not None
@@ -0,0 +1,102 @@
+"""
+.env generation in the setup wizard — template parsing and merge precedence
+"""
+import importlib.util
+from pathlib import Path
+
+import setup_wizard
+from setup_wizard import SetupWizard, _parse_dotenv
+
+
+def _read_env(path):
+    return dict(
+        line.split("=", 1) for line in path.read_text().splitlines()
+        if line and not line.startswith("#")
+    )
+
+
+def test_parse_dotenv_skips_comments_malformed_lines_and_placeholders():
+    text = """
+# Comment
+PARODY_CRITICS_ENV=development
+  SYNC_BATCH_SIZE = 50
+# LLM_PROVIDER=groq
+lower_case=ignored
+not a setting
+JELLYFIN_API_TOKEN=your-jellyfin-api-token-here
+JELLYFIN_DB_PATH=/path/to/jellyfin/library.db
+LLM_SECONDARY_MODEL=
+"""
+
+    assert _parse_dotenv(text) == {
+        "PARODY_CRITICS_ENV": "development",
+        "SYNC_BATCH_SIZE": "50",
+        "LLM_SECONDARY_MODEL": "",
+    }
+
+
+def test_wizard_answers_win_over_template(tmp_path, monkeypatch):
+    monkeypatch.setattr(setup_wizard.console, "print", lambda *args, **kwargs: None)
+    wizard = SetupWizard()
+    wizard.env_file = tmp_path / ".env"
+    wizard._env_template = _parse_dotenv("""
+PARODY_CRITICS_ENV=development
+PARODY_CRITICS_HOST=127.0.0.1
+LLM_PROVIDER=ollama
+LLM_PRIMARY_MODEL=mistral-small3.1:24b
+LLM_SECONDARY_MODEL=type32/eva-qwen-2.5-14b:latest
+LLM_OLLAMA_URL=http://ollama:11434
+AVATAR_DIR=data/avatars
+""")
+
+    assert wizard.create_env_file({
+        "JELLYFIN_URL": "http://jf:8096",
+        "JELLYFIN_API_TOKEN": "",
+        "LLM_PROVIDER": "openai",
+        "LLM_SECONDARY_MODEL": "",
+    })
+
+    env = _read_env(wizard.env_file)
+    # Collected answers win, empty ones included
+    assert env["LLM_PROVIDER"] == "openai"
+    assert env["LLM_SECONDARY_MODEL"] == ""
+    assert env["JELLYFIN_API_TOKEN"] == ""
+    # Wizard-managed keys the steps left unset aren't taken from the template
+    assert "LLM_PRIMARY_MODEL" not in env
+    assert "LLM_OLLAMA_URL" not in env
+    # The wizard's defaults beat the template; HOST/PORT use config.py's names
+    assert env["PARODY_CRITICS_ENV"] == "production"
+    assert env["PARODY_CRITICS_HOST"] == "0.0.0.0"
+    assert "HOST" not in env and "PORT" not in env
+    # Keys the wizard doesn't manage come from the template
+    assert env["AVATAR_DIR"] == "data/avatars"
+
+
+def test_empty_numeric_answers_keep_config_importable(tmp_path, monkeypatch):
+    monkeypatch.setattr(setup_wizard.console, "print", lambda *args, **kwargs: None)
+    wizard = SetupWizard()
+    wizard.env_file = tmp_path / ".env"
+    wizard._env_template = {}
+
+    assert wizard.create_env_file({
+        "LLM_PROVIDER": "ollama",
+        "LLM_TIMEOUT": "",
+        "LLM_MAX_RETRIES": None,
+        "LLM_SECONDARY_MODEL": "",
+    })
+
+    env = _read_env(wizard.env_file)
+    assert "LLM_TIMEOUT" not in env and "LLM_MAX_RETRIES" not in env
+    assert env["LLM_SECONDARY_MODEL"] == ""
+
+    # Load config.py against the generated .env, under its own module name so
+    # the already-imported config stays untouched
+    monkeypatch.setenv("PARODY_CRITICS_DOTENV_LOADED", "1")
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+    spec = importlib.util.spec_from_file_location(
+        "_wizard_config", Path(setup_wizard.__file__).with_name("config.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    assert module.Config.LLM_TIMEOUT == 180
+    assert module.Config.LLM_MAX_RETRIES == 2